@@ -0,0 +1,9 @@
+# Advanced EVE-Style Space Combat.
+#
+# Importing the package has no side effects: the window, the high-score
+# database and the main loop only start from eve.game.main() (python -m eve).
+# The game rules live in eve.simulation and run headless.
+from . import startup  # First: its IMPORT_START times the imports below.
+from .simulation import Simulation, SimInput
+
+__all__ = ["Simulation", "SimInput"]
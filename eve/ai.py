@@ -0,0 +1,271 @@
+from time import perf_counter
+
+try:
+    import numpy as np
+except ImportError:  # Enemies fall back to their own update_ai().
+    np = None
+
+from .config import WORLD_WIDTH, WORLD_HEIGHT
+from .entities import AI_Chaser, AI_Sniper
+
+# ---------------- Batched Enemy AI -----------------
+# AI_Chaser and AI_Sniper steering evaluated for every enemy of one type in a
+# single NumPy pass: a kernel turns, thrusts, clamps and decides who fires, the
+# fire events become bullets, and the whole batch is moved as Spaceship.update
+# would. Per-enemy tuning (acceleration, rotation_speed, max_speed,
+# shot_cooldown, as already scaled by aggression in spawn_enemies) is read from
+# each ship, so every enemy may be tuned differently.
+#
+# A batch's arrays persist between ticks while its membership is unchanged.
+# Positions and angles are written back to the ships every tick (collisions,
+# drones and drawing read them); velocity and last_shot, which only the AI
+# uses, are written back when the batch is dropped.
+#
+# The rules are the ones in AI_Chaser.update_ai and AI_Sniper.update_ai, which
+# remain the reference implementation and the fallback without NumPy. Groups
+# smaller than BATCH_MIN also use them: below that the fixed cost of the array
+# operations outweighs a few Python calls.
+BATCH_MIN = 16
+
+class ShipArrays:
+    # Struct-of-arrays copy of one group of ships.
+    __slots__ = ("ships", "x", "y", "vx", "vy", "angle", "last_shot", "acceleration",
+                 "rotation_speed", "max_speed", "shot_cooldown", "prev_x", "prev_y")
+
+    def __init__(self, ships):
+        n = len(ships)
+        self.ships = ships
+        self.x = np.fromiter((ship.x for ship in ships), float, n)
+        self.y = np.fromiter((ship.y for ship in ships), float, n)
+        self.vx = np.fromiter((ship.velocity.x for ship in ships), float, n)
+        self.vy = np.fromiter((ship.velocity.y for ship in ships), float, n)
+        self.angle = np.fromiter((ship.angle for ship in ships), float, n)
+        self.last_shot = np.fromiter((ship.last_shot for ship in ships), float, n)
+        self.acceleration = np.fromiter((ship.acceleration for ship in ships), float, n)
+        self.rotation_speed = np.fromiter((ship.rotation_speed for ship in ships), float, n)
+        self.max_speed = np.fromiter((ship.max_speed for ship in ships), float, n)
+        self.shot_cooldown = np.fromiter((ship.shot_cooldown for ship in ships), float, n)
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def store(self):
+        # Write positions and angles back onto the ships.
+        rows = zip(self.ships, self.x.tolist(), self.y.tolist(), self.angle.tolist(),
+                   self.prev_x.tolist(), self.prev_y.tolist())
+        for ship, x, y, angle, prev_x, prev_y in rows:
+            ship.x = x
+            ship.y = y
+            ship.angle = angle
+            ship.prev_x = prev_x
+            ship.prev_y = prev_y
+
+    def flush(self):
+        # Write back the state that store() leaves in the arrays.
+        rows = zip(self.ships, self.vx.tolist(), self.vy.tolist(), self.last_shot.tolist())
+        for ship, vx, vy, last_shot in rows:
+            ship.velocity.update(vx, vy)
+            ship.last_shot = last_shot
+
+def _turn(s, dx, dy):
+    # Rotate towards (dx, dy) by at most rotation_speed; returns the angle
+    # difference measured before turning.
+    desired = np.degrees(np.arctan2(-dy, dx))
+    diff = (desired - s.angle + 180) % 360 - 180
+    s.angle += np.clip(diff, -s.rotation_speed, s.rotation_speed)
+    return diff
+
+def _clamp_speed(s, rows=None):
+    speed = np.sqrt(s.vx * s.vx + s.vy * s.vy)
+    over = speed > s.max_speed
+    if rows is not None:
+        over &= rows
+    if over.any():
+        scale = s.max_speed[over] / speed[over]
+        s.vx[over] *= scale
+        s.vy[over] *= scale
+
+def _fire(s, diff, cone, now):
+    fire = (np.abs(diff) < cone) & (now - s.last_shot >= s.shot_cooldown)
+    s.last_shot[fire] = now
+    return fire
+
+def steer_chasers(s, tx, ty, now):
+    # AI_Chaser: turn towards the target, close in until 150 px away, then brake.
+    dx = tx - s.x
+    dy = ty - s.y
+    diff = _turn(s, dx, dy)
+    far = np.sqrt(dx * dx + dy * dy) > 150
+    push = np.where(far, s.acceleration * 0.5, 0.0)
+    rad = np.radians(s.angle)
+    s.vx += np.cos(rad) * push
+    s.vy -= np.sin(rad) * push
+    _clamp_speed(s, far)
+    near = ~far
+    s.vx[near] *= 0.95
+    s.vy[near] *= 0.95
+    return _fire(s, diff, AI_Chaser.fire_cone, now)
+
+def steer_snipers(s, tx, ty, now):
+    # AI_Sniper: back off inside 200 px, close in beyond 500 px and strafe
+    # around the target in between.
+    dx = tx - s.x
+    dy = ty - s.y
+    dist = np.sqrt(dx * dx + dy * dy)
+    safe = np.where(dist > 0, dist, 1.0)
+    ux = dx / safe
+    uy = dy / safe
+    close = dist < 200
+    far = dist > 500
+    gain = np.where(close | far, s.acceleration, s.acceleration * 0.5)
+    s.vx += np.where(close, -ux, np.where(far, ux, -uy)) * gain
+    s.vy += np.where(close, -uy, np.where(far, uy, ux)) * gain
+    _clamp_speed(s)
+    diff = _turn(s, dx, dy)
+    return _fire(s, diff, AI_Sniper.fire_cone, now)
+
+def move(s):
+    # Spaceship.update for the whole batch.
+    s.prev_x = s.x
+    s.prev_y = s.y
+    x = s.x + s.vx
+    y = s.y + s.vy
+    s.vx *= 0.99
+    s.vy *= 0.99
+    # Stop at the world's edges.
+    s.vx = np.where((x > WORLD_WIDTH) | (x < 0), 0.0, s.vx)
+    s.vy = np.where((y > WORLD_HEIGHT) | (y < 0), 0.0, s.vy)
+    s.x = np.clip(x, 0.0, float(WORLD_WIDTH))
+    s.y = np.clip(y, 0.0, float(WORLD_HEIGHT))
+
+def spawn_shots(s, fire, bullets, now):
+    # Turn a kernel's fire mask into bullets, as Spaceship.shoot would.
+    rows = np.flatnonzero(fire)
+    if not len(rows):
+        return
+    rad = np.radians(s.angle[rows])
+    bvx = (s.vx[rows] + np.cos(rad) * 10).tolist()
+    bvy = (s.vy[rows] - np.sin(rad) * 10).tolist()
+    for i, vx, vy in zip(rows.tolist(), bvx, bvy):
+        ship = s.ships[i]
+        bullets.spawn(s.x[i], s.y[i], vx, vy, ship.color, ship.bullet_owner, now)
+
+KERNELS = {AI_Chaser: steer_chasers, AI_Sniper: steer_snipers}
+
+# ---------------- Level-of-Detail Scheduling -----------------
+# Applies to ships steered one at a time in Python: drones, groups below
+# BATCH_MIN and every enemy when NumPy is missing. (A batch kernel costs about
+# as much as a few single updates, so slicing it would save nothing.)
+#
+# With an AIScheduler, ships that matter this tick steer every tick: those
+# within near_radius of the player, and those about to fire, that is with their
+# gun ready within the lookahead and aimed at their target as update_ai requires
+# (Spaceship.aims_at). The rest are time-sliced round-robin: each tick steers as
+# many of them as fit in what is left of budget_ms at the measured cost per
+# update, but at least enough that each one steers every max_stride ticks. A skipped ship keeps its
+# velocity and heading, so it still moves on its last decision. `deferred` is
+# the number of updates skipped in the last tick.
+#
+# The budget is measured with perf_counter, so a scheduled game is not
+# deterministic; a Simulation only schedules when given ai_budget_ms.
+AI_BUDGET_MS = 3.0
+AI_NEAR_RADIUS = 300
+AI_MAX_STRIDE = 6
+
+class AIScheduler:
+    def __init__(self, budget_ms=AI_BUDGET_MS, near_radius=AI_NEAR_RADIUS, max_stride=AI_MAX_STRIDE,
+                 lookahead_ms=0):
+        self.budget_ms = budget_ms
+        self.near_radius = near_radius
+        self.max_stride = max_stride
+        self.lookahead_ms = lookahead_ms
+        self.cost_ms = 0.01  # Running estimate of one steering update.
+        self.deferred = 0
+        self.deferred_total = 0
+        self._cursors = {}
+        self._tick_start = 0.0
+
+    def begin_tick(self):
+        self.deferred = 0
+        self._tick_start = perf_counter()
+
+    def is_critical(self, ship, tx, ty, now, target):
+        # (tx, ty): the player's position. target: what the ship shoots at, or
+        # None when it has nothing to shoot at.
+        dx = ship.x - tx
+        dy = ship.y - ty
+        if dx * dx + dy * dy < self.near_radius * self.near_radius:
+            return True
+        if target is None or now + self.lookahead_ms - ship.last_shot < ship.shot_cooldown:
+            return False
+        return ship.aims_at(target.x, target.y)
+
+    def plan(self, key, critical):
+        # critical: one bool per ship of the group `key`. Returns one bool per
+        # ship: steer it this tick or not.
+        active = list(critical)
+        distant = [i for i, is_critical in enumerate(critical) if not is_critical]
+        if not distant:
+            return active
+        spent_ms = (perf_counter() - self._tick_start) * 1000.0
+        affordable = int(max(0.0, self.budget_ms - spent_ms) / self.cost_ms)
+        quota = min(len(distant), max(-(-len(distant) // self.max_stride), affordable))
+        cursor = self._cursors.get(key, 0) % len(distant)
+        for j in range(cursor, cursor + quota):
+            active[distant[j % len(distant)]] = True
+        self._cursors[key] = cursor + quota
+        skipped = len(distant) - quota
+        self.deferred += skipped
+        self.deferred_total += skipped
+        return active
+
+    def charge(self, updates, seconds):
+        # Fold the measured cost of `updates` steering updates into cost_ms.
+        if updates:
+            self.cost_ms += 0.1 * (seconds * 1000.0 / updates - self.cost_ms)
+
+class EnemyAI:
+    # Steers, fires and moves every enemy for one tick. Enemies are grouped by
+    # type in order of first appearance, so bullets are spawned in the same
+    # order as a plain loop over spawn_enemies() output would.
+    def __init__(self):
+        self._batches = {}  # enemy type -> ShipArrays
+
+    def update(self, enemies, target, bullets, now, scheduler=None):
+        groups = {}
+        for enemy in enemies:
+            groups.setdefault(type(enemy), []).append(enemy)
+        for kind in [kind for kind in self._batches if kind not in groups]:
+            self._batches.pop(kind).flush()
+        for kind, ships in groups.items():
+            batch = self._batches.get(kind)
+            if batch is not None and batch.ships != ships:
+                self._batches.pop(kind).flush()
+                batch = None
+            kernel = KERNELS.get(kind)
+            if np is None or kernel is None or len(ships) < BATCH_MIN:
+                start = perf_counter()
+                if scheduler is None:
+                    active = None
+                else:
+                    critical = [scheduler.is_critical(ship, target.x, target.y, now, target)
+                                for ship in ships]
+                    active = scheduler.plan(kind, critical)
+                for i, ship in enumerate(ships):
+                    if active is None or active[i]:
+                        ship.update_ai(target, bullets, now)
+                    ship.update()
+                if scheduler is not None:
+                    scheduler.charge(sum(active), perf_counter() - start)
+                continue
+            # A kernel steers a whole batch for about the cost of a few Python
+            # updates, so batches are never time-sliced.
+            if batch is None:
+                batch = self._batches[kind] = ShipArrays(ships)
+            fire = kernel(batch, target.x, target.y, now)
+            spawn_shots(batch, fire, bullets, now)
+            move(batch)
+            batch.store()
+
+    def flush(self):
+        for batch in self._batches.values():
+            batch.flush()
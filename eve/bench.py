@@ -0,0 +1,259 @@
+# ---------------- Wave Scaling Benchmark -----------------
+# Runs seeded, scripted games through the headless Simulation and reports ticks
+# per second plus p50/p95/p99 per phase, with and without rendering:
+#
+#     python -m eve.bench --ticks 1800 --output bench.json
+#
+# Rendering goes to an off-screen display under the SDL dummy video driver, so
+# this works on a Linux box without X. Results are written as JSON so runs can
+# be compared across commits. --memory adds the traced allocation size of 10k
+# live bullets, effects and drones.
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from . import bullets as bullet_store
+from .config import WIDTH, HEIGHT, CYAN, RED
+from .effects import EffectPool, EXPLOSION
+from .entities import DronePool
+from .game import Hud, draw_playing
+from .quality import QualityGovernor
+from .simulation import Simulation, SimInput, PHASES
+from .starfield import Starfield
+from .stats import percentile
+
+# Every scenario holds fire and follows the same steering script; drone_interval
+# presses F every N ticks and force_field keeps J pressed (so the field is
+# re-armed whenever a free activation or token allows). bullets tops the player
+# and enemy pools up to that many live bullets before every tick (see
+# add_bullets), for a crowded screen no wave reaches by itself.
+SCENARIOS = {
+    "wave1": dict(wave=1),
+    "wave10": dict(wave=10),
+    "wave25": dict(wave=25),
+    "wave50": dict(wave=50),
+    "wave200": dict(wave=200),
+    "wave10_drones": dict(wave=10, drone_interval=120),
+    "wave25_drones": dict(wave=25, drone_interval=120),
+    "wave25_swarm": dict(wave=25, drone_interval=10),
+    "wave25_force_field": dict(wave=25, force_field=True),
+    "wave25_drones_force_field": dict(wave=25, drone_interval=120, force_field=True),
+    "wave25_bullets_5k": dict(wave=25, bullets=5000),
+    "wave200_bullets_5k": dict(wave=200, drone_interval=120, bullets=5000),
+}
+
+def scripted_input(tick, drone_interval=0, force_field=False, **_):
+    return SimInput(left=(tick // 90) % 3 == 0,
+                    right=(tick // 90) % 3 == 2,
+                    thrust=tick % 120 < 30,
+                    fire=True,
+                    deploy_drones=bool(drone_interval) and tick % drone_interval == 0,
+                    force_field=force_field)
+
+def add_bullets(sim, total, rng):
+    # Spawn bullets in the player's view until both pools together hold
+    # `total`, alternating owners; they fly off in random directions.
+    player = sim.player
+    for i in range(total - len(sim.bullets) - len(sim.enemy_bullets)):
+        x = player.x + rng.uniform(-WIDTH / 2, WIDTH / 2)
+        y = player.y + rng.uniform(-HEIGHT / 2, HEIGHT / 2)
+        angle = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(4, 10)
+        if i % 2:
+            pool, owner, color = sim.enemy_bullets, bullet_store.OWNER_ENEMY, RED
+        else:
+            pool, owner, color = sim.bullets, bullet_store.OWNER_PLAYER, CYAN
+        pool.spawn(x, y, math.cos(angle) * speed, math.sin(angle) * speed, color, owner, sim.time)
+
+class PhaseRecorder:
+    # Simulation timer hook that keeps every sample, in milliseconds.
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def record(self, phase, seconds):
+        self.samples[phase].append(seconds * 1000.0)
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "p50_ms": percentile(ordered, 50),
+        "p95_ms": percentile(ordered, 95),
+        "p99_ms": percentile(ordered, 99),
+        "mean_ms": sum(ordered) / len(ordered) if ordered else 0.0,
+    }
+
+def run_scenario(name, ticks, seed, render, screen=None, ai_budget=None, quality=0):
+    params = SCENARIOS[name]
+    random.seed(seed)  # Star positions.
+    sim = Simulation(start_wave=params["wave"], seed=seed, ai_budget_ms=ai_budget)
+    deferred = 0
+    recorder = PhaseRecorder()
+    sim.timer = recorder
+    starfield = Starfield() if render else None
+    hud = Hud() if render else None
+    governor = QualityGovernor(level=quality, adaptive=False)
+    if render:
+        starfield.set_near_density(governor.near_star_density)
+    peak_bullets = 0
+    peak_enemies = 0
+    bullet_rng = random.Random(seed)
+
+    start = perf_counter()
+    for tick in range(ticks):
+        if params.get("bullets"):
+            add_bullets(sim, params["bullets"], bullet_rng)
+        tick_start = perf_counter()
+        sim.step(scripted_input(tick, **params))
+        # Keep the player alive so every run covers the same number of ticks.
+        sim.player.health = 100
+        sim.game_over = False
+        if render:
+            render_start = perf_counter()
+            starfield.scroll(sim.player.velocity)
+            starfield.draw(screen)
+            draw_playing(screen, sim, hud, quality=governor)
+            pygame.display.flip()
+            recorder.record("render", perf_counter() - render_start)
+        recorder.record("tick", perf_counter() - tick_start)
+        peak_bullets = max(peak_bullets, len(sim.bullets) + len(sim.enemy_bullets))
+        peak_enemies = max(peak_enemies, len(sim.enemies))
+        deferred += sim.ai_deferred
+    elapsed = perf_counter() - start
+
+    phases = PHASES + ("render", "tick") if render else PHASES + ("tick",)
+    return {
+        "scenario": name,
+        "render": render,
+        "quality": quality,
+        "ticks": ticks,
+        "seed": seed,
+        "elapsed_s": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed else 0.0,
+        "final_wave": sim.wave,
+        "score": sim.score,
+        "peak_bullets": peak_bullets,
+        "peak_enemies": peak_enemies,
+        "drones": len(sim.drones),
+        "ai_deferred_per_tick": deferred / ticks if ticks else 0.0,
+        "phases": {phase: summarize(recorder.samples[phase]) for phase in phases},
+    }
+
+MEMORY_SAMPLE = 10000
+
+def _traced_bytes(build):
+    # Bytes still allocated by build() once it returns (its result kept alive).
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        keep = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del keep
+    return after - before
+
+def measure_memory(n=MEMORY_SAMPLE):
+    def bullets():
+        pool = bullet_store.BulletPool()
+        for i in range(n):
+            pool.spawn(i % WIDTH, i % HEIGHT, 1.0, 0.0, CYAN, bullet_store.OWNER_PLAYER, 0.0)
+        return pool
+
+    def effects():
+        pool = EffectPool(n)
+        for i in range(n):
+            pool.spawn(EXPLOSION, i % WIDTH, i % HEIGHT)
+        return pool
+
+    def drones():
+        pool = DronePool(0)
+        return [pool.spawn(i % WIDTH, i % HEIGHT, None) for i in range(n)]
+
+    return {"live": n, "bullets_bytes": _traced_bytes(bullets),
+            "effects_bytes": _traced_bytes(effects), "drones_bytes": _traced_bytes(drones)}
+
+def git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                             text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+def print_report(results, out=sys.stdout):
+    print(f"{'scenario':<28}{'render':>7}{'ticks/s':>10}{'tick p50':>10}{'p95':>8}{'p99':>8}"
+          f"{'bullets':>9}{'enemies':>9}", file=out)
+    for result in results:
+        tick = result["phases"]["tick"]
+        print(f"{result['scenario']:<28}{'yes' if result['render'] else 'no':>7}"
+              f"{result['ticks_per_second']:>10.0f}{tick['p50_ms']:>10.3f}{tick['p95_ms']:>8.3f}"
+              f"{tick['p99_ms']:>8.3f}{result['peak_bullets']:>9}{result['peak_enemies']:>9}", file=out)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m eve.bench",
+                                     description="Seeded wave-scaling benchmark for the simulation.")
+    parser.add_argument("--ticks", type=int, default=1800, help="ticks per scenario (default: 1800)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--render", choices=("off", "on", "both"), default="both")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--ai-budget", type=float, metavar="MS",
+                        help="time-slice distant AI to this budget per tick (default: off)")
+    parser.add_argument("--quality", type=int, choices=range(5), default=0,
+                        help="effects quality level to render at (default: 0, everything)")
+    parser.add_argument("--memory", action="store_true",
+                        help=f"also report memory for {MEMORY_SAMPLE} live bullets, effects and drones")
+    args = parser.parse_args(argv)
+
+    names = args.scenario or list(SCENARIOS)
+    modes = {"off": [False], "on": [True], "both": [False, True]}[args.render]
+    screen = None
+    if True in modes:
+        pygame.display.init()
+        pygame.font.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+    results = [run_scenario(name, args.ticks, args.seed, render, screen, args.ai_budget,
+                            args.quality)
+               for name in names for render in modes]
+    print_report(results)
+    memory = None
+    if args.memory:
+        memory = measure_memory()
+        print(f"memory per {memory['live']} live: "
+              f"bullets {memory['bullets_bytes'] / 1024:.0f} KiB, "
+              f"effects {memory['effects_bytes'] / 1024:.0f} KiB, "
+              f"drones {memory['drones_bytes'] / 1024:.0f} KiB")
+
+    if args.output:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": bullet_store.np.__version__ if bullet_store.np is not None else None,
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            "ai_budget_ms": args.ai_budget,
+            "results": results,
+            "memory": memory,
+        }
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
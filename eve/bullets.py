@@ -0,0 +1,309 @@
+from array import array
+
+import pygame
+
+from .config import WORLD_WIDTH, WORLD_HEIGHT
+
+try:
+    import numpy as np
+except ImportError:  # BulletPool falls back to the stdlib array module.
+    np = None
+
+# ---------------- Bullet Store (struct of arrays) -----------------
+# Bullets are not objects: every live projectile is one row across parallel
+# arrays, advanced, culled and expired in a handful of vectorized operations.
+# Rows are removed by swap-remove (holes are filled from the tail), so row order
+# is not stable across removals. A pool starts with room for `capacity` rows and
+# doubles when full; `hits` counts spawns that fit, `misses` the ones that had
+# to grow it.
+#
+# Bullets fly through the whole world until they leave it or expire, whether on
+# screen or not; off screen they only cost their share of the vectorized update
+# and collision passes, since draw() culls them (see eve.camera).
+OWNER_PLAYER = 0
+OWNER_DRONE = 1
+OWNER_ENEMY = 2
+BULLET_RADIUS = 3
+BULLET_LIFETIME = 2000  # milliseconds
+BULLET_POOL_CAPACITY = 256
+
+def swap_remove_plan(holes, count):
+    # holes: sorted, unique row indices. Returns (dst, src, new_count) such that
+    # copying row src[i] into dst[i] leaves rows [0, new_count) all alive.
+    new_count = count - len(holes)
+    dst = [i for i in holes if i < new_count]
+    dead_tail = set(i for i in holes if i >= new_count)
+    src = [i for i in range(new_count, count) if i not in dead_tail]
+    return dst, src, new_count
+
+class _NumpyBulletPool:
+    _fields = ("x", "y", "vx", "vy", "spawn_time", "owner", "color")
+
+    def __init__(self, capacity=BULLET_POOL_CAPACITY):
+        self.count = 0
+        self.hits = 0
+        self.misses = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.spawn_time = np.zeros(capacity)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.x)
+
+    def _grow(self):
+        for name in self._fields:
+            old = getattr(self, name)
+            new = np.zeros((len(old) * 2,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x, y, vx, vy, color, owner, now):
+        if self.count == len(self.x):
+            self.misses += 1
+            self._grow()
+        else:
+            self.hits += 1
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.spawn_time[i] = now
+        self.owner[i] = owner
+        self.color[i] = color
+        self.count = i + 1
+
+    def update(self, now):
+        n = self.count
+        if not n:
+            return
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        dead = (x > WORLD_WIDTH) | (x < 0) | (y > WORLD_HEIGHT) | (y < 0)
+        dead |= (now - self.spawn_time[:n]) > BULLET_LIFETIME
+        if dead.any():
+            self._swap_remove(np.flatnonzero(dead))
+
+    def remove(self, indices):
+        if indices:
+            self._swap_remove(np.unique(np.fromiter(indices, dtype=np.intp)))
+
+    def _swap_remove(self, holes):
+        n = self.count
+        m = n - len(holes)
+        dst = holes[holes < m]
+        if len(dst):
+            alive_tail = np.ones(n - m, dtype=bool)
+            alive_tail[holes[holes >= m] - m] = False
+            src = np.flatnonzero(alive_tail) + m
+            for name in self._fields:
+                arr = getattr(self, name)
+                arr[dst] = arr[src]
+        self.count = m
+
+    def clear(self):
+        self.count = 0
+
+    def positions(self):
+        n = self.count
+        return self.x[:n].tolist(), self.y[:n].tolist()
+
+    def rows_near(self, xs, ys, r, cell_size):
+        # (rows, xs, ys) of the bullets in a cell of a cell_size grid touched by
+        # the box (x±r, y±r) around any of the points (xs, ys), in row order;
+        # every bullet within r of a point is among them. The touched cells are
+        # marked in a boolean grid over the world, which each bullet's cell
+        # then indexes, so both sides are vectorized.
+        n = self.count
+        if not n or not xs:
+            return [], [], []
+        columns = int(WORLD_WIDTH // cell_size) + 1
+        lines = int(WORLD_HEIGHT // cell_size) + 1
+        near = np.zeros((columns, lines), dtype=bool)
+        px = np.asarray(xs, dtype=float)
+        py = np.asarray(ys, dtype=float)
+        cx0 = (px - r) // cell_size
+        cx1 = (px + r) // cell_size
+        cy0 = (py - r) // cell_size
+        cy1 = (py + r) // cell_size
+        span = int(2 * r // cell_size) + 2  # Most cells a box touches per axis.
+        for i in range(span):
+            cx = np.clip(np.minimum(cx0 + i, cx1), 0, columns - 1).astype(np.intp)
+            for j in range(span):
+                near[cx, np.clip(np.minimum(cy0 + j, cy1), 0, lines - 1).astype(np.intp)] = True
+        x = self.x[:n]
+        y = self.y[:n]
+        bx = np.clip(x // cell_size, 0, columns - 1).astype(np.intp)
+        by = np.clip(y // cell_size, 0, lines - 1).astype(np.intp)
+        rows = np.flatnonzero(near[bx, by])
+        return rows.tolist(), x[rows].tolist(), y[rows].tolist()
+
+    def get_state(self):
+        # One [x, y, vx, vy, color, owner, spawn_time] row per bullet, in row order.
+        n = self.count
+        return [list(row) for row in zip(self.x[:n].tolist(), self.y[:n].tolist(),
+                                         self.vx[:n].tolist(), self.vy[:n].tolist(),
+                                         self.color[:n].tolist(), self.owner[:n].tolist(),
+                                         self.spawn_time[:n].tolist())]
+
+    def set_state(self, state):
+        self.clear()
+        for x, y, vx, vy, color, owner, spawn_time in state:
+            self.spawn(x, y, vx, vy, color, owner, spawn_time)
+
+    def draw(self, surface, dirty=None, alpha=1.0, camera=None):
+        # dirty: optional list that receives the rect of every bullet drawn.
+        # alpha < 1 draws each bullet that far along its last tick's movement.
+        # camera: an eve.camera.Camera; only bullets in its view are drawn.
+        n = self.count
+        if alpha < 1:
+            back = 1.0 - alpha
+            xs = self.x[:n] - self.vx[:n] * back
+            ys = self.y[:n] - self.vy[:n] * back
+        else:
+            xs = self.x[:n]
+            ys = self.y[:n]
+        colors = self.color[:n]
+        if camera is not None:
+            xs, ys, visible = camera.project(xs, ys)
+            xs = xs[visible]
+            ys = ys[visible]
+            colors = colors[visible]
+        xs = xs.astype(int).tolist()
+        ys = ys.astype(int).tolist()
+        if dirty is None:
+            for x, y, color in zip(xs, ys, colors.tolist()):
+                pygame.draw.circle(surface, color, (x, y), BULLET_RADIUS)
+        else:
+            for x, y, color in zip(xs, ys, colors.tolist()):
+                dirty.append(pygame.draw.circle(surface, color, (x, y), BULLET_RADIUS))
+
+class _ArrayBulletPool:
+    # Same interface as _NumpyBulletPool on top of array.array; used when NumPy
+    # is not installed. Arrays are kept exactly `count` rows long; `capacity`
+    # only tracks the high-water mark the hit/miss counters are measured against.
+    def __init__(self, capacity=BULLET_POOL_CAPACITY):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.x = array("d")
+        self.y = array("d")
+        self.vx = array("d")
+        self.vy = array("d")
+        self.spawn_time = array("d")
+        self.owner = array("b")
+        self.color = array("B")  # Three bytes per row.
+
+    @property
+    def count(self):
+        return len(self.x)
+
+    def __len__(self):
+        return len(self.x)
+
+    def spawn(self, x, y, vx, vy, color, owner, now):
+        if len(self.x) == self.capacity:
+            self.misses += 1
+            self.capacity *= 2
+        else:
+            self.hits += 1
+        self.x.append(x)
+        self.y.append(y)
+        self.vx.append(vx)
+        self.vy.append(vy)
+        self.spawn_time.append(now)
+        self.owner.append(owner)
+        self.color.extend(color[:3])
+
+    def update(self, now):
+        xs, ys, vxs, vys, spawn = self.x, self.y, self.vx, self.vy, self.spawn_time
+        dead = []
+        for i in range(len(xs)):
+            x = xs[i] + vxs[i]
+            y = ys[i] + vys[i]
+            xs[i] = x
+            ys[i] = y
+            if (x > WORLD_WIDTH or x < 0 or y > WORLD_HEIGHT or y < 0
+                    or now - spawn[i] > BULLET_LIFETIME):
+                dead.append(i)
+        if dead:
+            self._swap_remove(dead)
+
+    def remove(self, indices):
+        if indices:
+            self._swap_remove(sorted(set(indices)))
+
+    def _swap_remove(self, holes):
+        dst, src, m = swap_remove_plan(holes, len(self.x))
+        for name in ("x", "y", "vx", "vy", "spawn_time", "owner"):
+            arr = getattr(self, name)
+            for d, s in zip(dst, src):
+                arr[d] = arr[s]
+            del arr[m:]
+        color = self.color
+        for d, s in zip(dst, src):
+            color[3 * d:3 * d + 3] = color[3 * s:3 * s + 3]
+        del color[3 * m:]
+
+    def clear(self):
+        for name in ("x", "y", "vx", "vy", "spawn_time", "owner", "color"):
+            del getattr(self, name)[:]
+
+    def positions(self):
+        return self.x.tolist(), self.y.tolist()
+
+    def rows_near(self, xs, ys, r, cell_size):
+        cells = set()
+        for px, py in zip(xs, ys):
+            for cx in range(int((px - r) // cell_size), int((px + r) // cell_size) + 1):
+                for cy in range(int((py - r) // cell_size), int((py + r) // cell_size) + 1):
+                    cells.add((cx, cy))
+        rows = []
+        near_xs = []
+        near_ys = []
+        for row, (x, y) in enumerate(zip(self.x, self.y)):
+            if (int(x // cell_size), int(y // cell_size)) in cells:
+                rows.append(row)
+                near_xs.append(x)
+                near_ys.append(y)
+        return rows, near_xs, near_ys
+
+    def get_state(self):
+        color = self.color.tolist()
+        colors = [color[3 * i:3 * i + 3] for i in range(len(self.x))]
+        return [list(row) for row in zip(self.x.tolist(), self.y.tolist(), self.vx.tolist(),
+                                         self.vy.tolist(), colors, self.owner.tolist(),
+                                         self.spawn_time.tolist())]
+
+    def set_state(self, state):
+        self.clear()
+        for x, y, vx, vy, color, owner, spawn_time in state:
+            self.spawn(x, y, vx, vy, color, owner, spawn_time)
+
+    def draw(self, surface, dirty=None, alpha=1.0, camera=None):
+        color = self.color
+        back = 1.0 - alpha if alpha < 1 else 0.0
+        for i in range(len(self.x)):
+            x = self.x[i] - self.vx[i] * back
+            y = self.y[i] - self.vy[i] * back
+            if camera is not None:
+                pos = camera.to_screen(x, y)
+                if pos is None:
+                    continue
+                x, y = pos
+            rect = pygame.draw.circle(surface, color[3 * i:3 * i + 3].tolist(), (int(x), int(y)),
+                                      BULLET_RADIUS)
+            if dirty is not None:
+                dirty.append(rect)
+
+BulletPool = _NumpyBulletPool if np is not None else _ArrayBulletPool
@@ -0,0 +1,39 @@
+from .config import WIDTH, HEIGHT, WORLD_WIDTH, WORLD_HEIGHT, VIEW_MARGIN
+
+# ---------------- Camera -----------------
+# The screen shows a WIDTH x HEIGHT window of the world, centred on whatever the
+# camera follows (the player) but never reaching past the world's edges, where
+# the player moves off centre instead. Anything more than `margin` pixels
+# outside the view is culled: draw cost follows what is on screen, not how much
+# is in the world.
+class Camera:
+    def __init__(self, width=WIDTH, height=HEIGHT, margin=VIEW_MARGIN):
+        self.width = width
+        self.height = height
+        self.margin = margin
+        self.left = 0.0  # World position of the view's top-left corner.
+        self.top = 0.0
+
+    def follow(self, x, y):
+        self.left = min(max(x - self.width / 2, 0.0), WORLD_WIDTH - self.width)
+        self.top = min(max(y - self.height / 2, 0.0), WORLD_HEIGHT - self.height)
+
+    def to_screen(self, x, y):
+        # Screen position of world point (x, y), or None when it is culled.
+        margin = self.margin
+        sx = x - self.left
+        if sx < -margin or sx > self.width + margin:
+            return None
+        sy = y - self.top
+        if sy < -margin or sy > self.height + margin:
+            return None
+        return sx, sy
+
+    def project(self, xs, ys):
+        # to_screen() for NumPy arrays: (screen xs, screen ys, visible mask).
+        margin = self.margin
+        sx = xs - self.left
+        sy = ys - self.top
+        visible = ((sx >= -margin) & (sx <= self.width + margin)
+                   & (sy >= -margin) & (sy <= self.height + margin))
+        return sx, sy, visible
@@ -0,0 +1,121 @@
+# ---------------- Spatial Hash Collision Grid -----------------
+# Uniform grid used as the broad phase for every bullet collision pass. Ships are
+# bucketed by the cell holding their centre; a query scans the cells overlapping
+# the search box and the caller does the exact (squared distance) test.
+# nearest() answers nearest-neighbour queries (drone targeting) by scanning
+# rings of cells outwards until no unscanned cell can hold anything closer.
+COLLISION_CELL_SIZE = 64
+TARGET_CELL_SIZE = 128  # Coarser cells suit nearest() queries across the world.
+
+class SpatialHash:
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self._bounds = None  # Occupied cell range, computed on demand by nearest().
+
+    def clear(self):
+        self.cells.clear()
+        self._bounds = None
+
+    def insert(self, index, obj):
+        self._bounds = None
+        key = (int(obj.x // self.cell_size), int(obj.y // self.cell_size))
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [(index, obj)]
+        else:
+            cell.append((index, obj))
+
+    def rebuild(self, objects):
+        self.clear()
+        for index, obj in enumerate(objects):
+            self.insert(index, obj)
+
+    def query(self, x, y, r):
+        # Candidates whose centre lies in a cell touched by the box (x±r, y±r).
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for cx in range(int((x - r) // size), int((x + r) // size) + 1):
+            for cy in range(int((y - r) // size), int((y + r) // size) + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.extend(cell)
+        return found
+
+    def nearest(self, x, y):
+        # The (index, obj) whose centre is closest to (x, y), lowest index on a
+        # tie, or None when the grid is empty.
+        cells = self.cells
+        if not cells:
+            return None
+        if self._bounds is None:
+            keys = list(cells)
+            self._bounds = (min(k[0] for k in keys), max(k[0] for k in keys),
+                            min(k[1] for k in keys), max(k[1] for k in keys))
+        min_cx, max_cx, min_cy, max_cy = self._bounds
+        size = self.cell_size
+        ox = int(x // size)
+        oy = int(y // size)
+        best = None
+        best_d2 = 0.0
+        rings = max(ox - min_cx, max_cx - ox, oy - min_cy, max_cy - oy)
+        for ring in range(max(0, rings) + 1):
+            # Every cell in this ring is at least (ring - 1) cells away.
+            if best is not None and best_d2 < (ring - 1) * (ring - 1) * size * size:
+                break
+            for cx in range(max(ox - ring, min_cx), min(ox + ring, max_cx) + 1):
+                if cx == ox - ring or cx == ox + ring:
+                    column = range(max(oy - ring, min_cy), min(oy + ring, max_cy) + 1)
+                else:
+                    column = (oy - ring, oy + ring)
+                for cy in column:
+                    cell = cells.get((cx, cy))
+                    if not cell:
+                        continue
+                    for index, obj in cell:
+                        dx = obj.x - x
+                        dy = obj.y - y
+                        d2 = dx * dx + dy * dy
+                        if best is None or d2 < best_d2 or (d2 == best_d2 and index < best[0]):
+                            best = (index, obj)
+                            best_d2 = d2
+        return best
+
+def resolve_bullet_hits(bullets, ships, grid, damage):
+    # Each bullet row hits the first live ship (in list order) it overlaps,
+    # exactly like the old nested loops. Returns the spent bullet rows and the
+    # (ship, bullet row) pairs for ships whose health dropped to zero; the caller
+    # removes both in one batch.
+    #
+    # The bullet pool picks out, in one pass over its arrays, the rows lying in
+    # a grid cell within reach of some ship (BulletPool.rows_near); only those,
+    # usually a handful however many bullets fly, are tested one at a time.
+    spent = set()
+    killed = []
+    if not len(bullets) or not ships:
+        return spent, killed
+    grid.rebuild(ships)
+    reach = max(ship.radius for ship in ships)
+    dead = set()
+    rows, xs, ys = bullets.rows_near([ship.x for ship in ships], [ship.y for ship in ships],
+                                     reach, grid.cell_size)
+    for row, bx, by in zip(rows, xs, ys):
+        hit_index = None
+        hit_ship = None
+        for index, ship in grid.query(bx, by, reach):
+            if index in dead or (hit_index is not None and index > hit_index):
+                continue
+            dx = bx - ship.x
+            dy = by - ship.y
+            if dx * dx + dy * dy < ship.radius * ship.radius:
+                hit_index = index
+                hit_ship = ship
+        if hit_ship is None:
+            continue
+        hit_ship.health -= damage
+        spent.add(row)
+        if hit_ship.health <= 0:
+            dead.add(hit_index)
+            killed.append((hit_ship, row))
+    return spent, killed
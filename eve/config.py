@@ -0,0 +1,40 @@
+from collections import namedtuple
+
+# ---------------- Screen and Timing -----------------
+WIDTH, HEIGHT = 800, 600
+FPS = 60                  # Default render cap.
+TICK_RATE = 60            # Simulation ticks per second, independent of rendering.
+MAX_CATCH_UP_STEPS = 5    # Most ticks run in one frame before the game slows down.
+
+# ---------------- World -----------------
+# The battlefield is larger than the screen and ends at its edges; the screen
+# is a WIDTH x HEIGHT view of it that follows the player (see eve.camera).
+WORLD_WIDTH, WORLD_HEIGHT = 3 * WIDTH, 3 * HEIGHT
+VIEW_MARGIN = 96  # Drawn beyond the view edge; covers the largest explosion frame.
+
+# ---------------- Colors -----------------
+BLACK    = (0, 0, 0)
+WHITE    = (255, 255, 255)
+YELLOW   = (255, 255, 0)
+RED      = (255, 0, 0)
+GREEN    = (0, 255, 0)
+ORANGE   = (255, 165, 0)
+CYAN     = (0, 255, 255)
+BLUE     = (0, 0, 255)
+
+# ---------------- Game Rules -----------------
+# Force field duration (20 seconds now)
+FORCE_FIELD_DURATION = 20000
+FREE_FORCE_FIELDS = 5  # First activations that cost no tokens.
+
+# Enemy aggression per start-screen mode: 1 = Standard, 2 = 75% Less Aggressive.
+MODE_AGGRESSION = {1: 1.0, 2: 0.25}
+
+# Balance knobs a Simulation takes as one value, so balancing sweeps (eve.sweep)
+# can vary them per game. Wave w spawns chasers_base + chasers_per_wave * w
+# chasers and max(1, snipers_base + snipers_per_wave * w) snipers; cooldowns
+# are in milliseconds, before aggression scaling.
+Tuning = namedtuple("Tuning", "chasers_base chasers_per_wave snipers_base snipers_per_wave "
+                              "chaser_cooldown sniper_cooldown force_field_duration",
+                    defaults=(1, 1, -1, 1, 1000, 1500, FORCE_FIELD_DURATION))
+DEFAULT_TUNING = Tuning()
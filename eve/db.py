@@ -0,0 +1,62 @@
+import queue
+import sqlite3
+import sys
+import threading
+
+# ---------------- High Score Store -----------------
+# One long-lived connection in WAL mode, an index on score and an in-memory copy
+# of the top scores. Reads (the start screen asks every frame) only return that
+# copy. save_score() queues the row for a background writer thread, which
+# inserts, commits and then refreshes the copy, so neither the menu nor the
+# game-over frame ever waits on the disk.
+DB_PATH = "highscores.db"
+TOP_SCORES = 3
+
+class ScoreStore:
+    def __init__(self, path=DB_PATH, top_n=TOP_SCORES):
+        self.path = path
+        self.top_n = top_n
+        # Shared with the writer thread; every use holds _lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("CREATE TABLE IF NOT EXISTS highscores (name TEXT, score INTEGER)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS highscores_score ON highscores (score DESC)")
+            self._conn.commit()
+            self._top = self._query_top()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="score-writer", daemon=True)
+        self._writer.start()
+
+    def _query_top(self):
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT name, score FROM highscores ORDER BY score DESC LIMIT ?", (self.top_n,))
+        return cursor.fetchall()
+
+    def top_scores(self):
+        return self._top
+
+    def save_score(self, name, score):
+        self._queue.put((name, score))
+
+    def _write_loop(self):
+        while True:
+            row = self._queue.get()
+            if row is None:
+                return
+            try:
+                with self._lock:
+                    self._conn.execute("INSERT INTO highscores (name, score) VALUES (?, ?)", row)
+                    self._conn.commit()
+                    self._top = self._query_top()
+            except sqlite3.Error as exc:
+                # Keep the writer alive; losing one score beats losing all later ones.
+                print(f"Could not save high score {row!r}: {exc}", file=sys.stderr)
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+        with self._lock:
+            self._conn.close()
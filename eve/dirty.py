@@ -0,0 +1,59 @@
+import pygame
+
+# ---------------- Dirty Rectangle Renderer -----------------
+# Optional presentation mode for software-rendered displays. Draw calls report
+# the rect they touched into `rects`. The next frame repaints the background only
+# under last frame's rects, then pushes last frame's and this frame's rects with
+# pygame.display.update(). A frame falls back to a full redraw when the
+# background itself changed (e.g. the near stars scrolled) or invalidate() was
+# called, and to a full flip when the dirty area exceeds `threshold` of the
+# screen.
+#
+# Disabled, it behaves like the plain loop: full background, flip, rects is None.
+DIRTY_AREA_THRESHOLD = 0.35  # Fraction of the screen.
+
+class DirtyRenderer:
+    def __init__(self, screen, enabled=True, threshold=DIRTY_AREA_THRESHOLD):
+        self.screen = screen
+        self.enabled = enabled
+        self.max_area = threshold * screen.get_width() * screen.get_height()
+        self.rects = [] if enabled else None
+        self.previous = []
+        self.full = True
+        self._force_full = True
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    def invalidate(self):
+        # Repaint everything next frame (state change, resize, overlay toggle...).
+        self._force_full = True
+
+    def begin(self, background):
+        # background: has draw(screen) for a full repaint, restore(screen, rect)
+        # to repaint one rect, and changed() -> True when a full repaint is due.
+        if not self.enabled or self._force_full or background.changed():
+            background.draw(self.screen)
+            self.full = True
+        else:
+            for rect in self.previous:
+                background.restore(self.screen, rect)
+            self.full = False
+        self._force_full = False
+
+    def present(self):
+        if not self.enabled:
+            pygame.display.flip()
+            return
+        current = self.rects
+        if not self.full:
+            dirty = self.previous + current
+            if sum(rect.w * rect.h for rect in dirty) <= self.max_area:
+                pygame.display.update(dirty)
+                self.partial_frames += 1
+            else:
+                self.full = True
+        if self.full:
+            pygame.display.flip()
+            self.full_frames += 1
+        self.previous = current
+        self.rects = []
@@ -0,0 +1,158 @@
+import pygame
+
+from .config import BLACK, ORANGE
+
+# ---------------- Effect Kinds -----------------
+# An effect kind is an animation whose every frame is rendered once into a
+# single atlas surface; drawing a live effect is one blit of its current frame's
+# area. New effects (debris, shield hits, ...) only need a frame renderer and a
+# frame count: register them with EffectKind and spawn them from an EffectPool.
+class EffectKind:
+    def __init__(self, name, frame_count, render_frame):
+        # render_frame(frame) -> (surface, (dx, dy)): the frame image and where its
+        # top-left corner sits relative to the effect position.
+        self.name = name
+        self.frame_count = frame_count
+        self.render_frame = render_frame
+        self.atlas = None
+        self.opaque_atlas = None  # Frames pre-blended onto black, for low quality.
+        self.areas = []    # Atlas rect per frame.
+        self.offsets = []  # Blit offset per frame.
+
+    def bake(self):
+        if self.atlas is not None:
+            return
+        frames = [self.render_frame(frame) for frame in range(self.frame_count)]
+        width = sum(image.get_width() for image, _ in frames)
+        height = max(image.get_height() for image, _ in frames)
+        atlas = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+        x = 0
+        for image, offset in frames:
+            atlas.blit(image, (x, 0))
+            self.areas.append(pygame.Rect(x, 0, image.get_width(), image.get_height()))
+            self.offsets.append(offset)
+            x += image.get_width()
+        # Against the black of space, a translucent frame looks like the same
+        # frame blended onto black; colorkeyed, that copy blits without per-pixel
+        # alpha.
+        opaque = pygame.Surface(atlas.get_size())
+        opaque.fill(BLACK)
+        opaque.blit(atlas, (0, 0))
+        opaque.set_colorkey(BLACK, pygame.RLEACCEL)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+            opaque = opaque.convert()
+        self.atlas = atlas
+        self.opaque_atlas = opaque
+
+    def draw(self, surface, frame, x, y, blend=True):
+        if self.atlas is None:
+            self.bake()
+        dx, dy = self.offsets[frame]
+        atlas = self.atlas if blend else self.opaque_atlas
+        return surface.blit(atlas, (x + dx, y + dy), self.areas[frame])
+
+def _explosion_frame(frame):
+    # Frame n is the explosion after n updates: the radius grows by 1.5 and the
+    # alpha drops by 5 per tick, so it has faded out after 51 ticks.
+    radius = 5 + 1.5 * frame
+    alpha = max(0, 255 - 5 * frame)
+    image = pygame.Surface((int(radius*2), int(radius*2)), pygame.SRCALPHA)
+    pygame.draw.circle(image, ORANGE + (alpha,), (int(radius), int(radius)), int(radius))
+    return image, (-radius, -radius)
+
+EXPLOSION = EffectKind("explosion", 51, _explosion_frame)
+EFFECT_KINDS = [EXPLOSION]
+
+def bake_effects():
+    # Pre-render every registered effect; call once after the display is up.
+    for kind in EFFECT_KINDS:
+        kind.bake()
+
+# ---------------- Effect Pool -----------------
+class Effect:
+    __slots__ = ("kind", "x", "y", "frame")
+
+    def __init__(self):
+        self.kind = None
+        self.x = 0
+        self.y = 0
+        self.frame = 0
+
+EFFECT_POOL_CAPACITY = 128
+
+class EffectPool:
+    # Fixed number of Effect objects allocated up front. Spawning takes one from
+    # the free list (a hit); when all are live the oldest effect is recycled
+    # instead of allocating (a miss). Iterating the pool yields the live
+    # effects, oldest first.
+    def __init__(self, capacity=EFFECT_POOL_CAPACITY):
+        self.capacity = capacity
+        self.active = []
+        self.free = [Effect() for _ in range(capacity)]
+        self.hits = 0
+        self.misses = 0  # Live effects cut short because the pool was full.
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def spawn(self, kind, x, y):
+        if self.free:
+            effect = self.free.pop()
+            self.hits += 1
+        else:
+            effect = self.active.pop(0)
+            self.misses += 1
+        effect.kind = kind
+        effect.x = x
+        effect.y = y
+        effect.frame = 0
+        self.active.append(effect)
+        return effect
+
+    def update(self):
+        # Advance every effect one frame and return finished ones to the free list.
+        finished = False
+        for effect in self.active:
+            effect.frame += 1
+            if effect.frame >= effect.kind.frame_count:
+                finished = True
+        if finished:
+            live = []
+            for effect in self.active:
+                if effect.frame >= effect.kind.frame_count:
+                    self.free.append(effect)
+                else:
+                    live.append(effect)
+            self.active = live
+
+    def clear(self):
+        self.free.extend(self.active)
+        self.active = []
+
+    def get_state(self):
+        return [[effect.kind.name, effect.x, effect.y, effect.frame] for effect in self.active]
+
+    def set_state(self, state):
+        kinds = {kind.name: kind for kind in EFFECT_KINDS}
+        self.clear()
+        for name, x, y, frame in state:
+            self.spawn(kinds[name], x, y).frame = frame
+
+    def draw(self, surface, dirty=None, blend=True, camera=None):
+        # dirty: optional list that receives the rect of every effect drawn.
+        # blend=False draws the opaque atlas (see EffectKind.bake). camera: an
+        # eve.camera.Camera; only effects in its view are drawn.
+        for effect in self.active:
+            x, y = effect.x, effect.y
+            if camera is not None:
+                pos = camera.to_screen(x, y)
+                if pos is None:
+                    continue
+                x, y = pos
+            rect = effect.kind.draw(surface, effect.frame, x, y, blend)
+            if dirty is not None:
+                dirty.append(rect)
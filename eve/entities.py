@@ -0,0 +1,323 @@
+import math
+import random
+
+import pygame
+
+from .bullets import OWNER_PLAYER, OWNER_DRONE, OWNER_ENEMY
+from .config import WORLD_WIDTH, WORLD_HEIGHT, RED, GREEN, CYAN, DEFAULT_TUNING
+
+# ---------------- Spaceship Classes -----------------
+# Entities never read the wall clock: every time-dependent call takes `now`, the
+# owning Simulation's clock in milliseconds. Every class declares __slots__, so
+# ships carry no per-instance __dict__.
+class Spaceship:
+    __slots__ = ("x", "y", "prev_x", "prev_y", "color", "angle", "velocity", "acceleration",
+                 "rotation_speed", "max_speed", "radius", "health", "last_shot", "shot_cooldown",
+                 "thrust")
+    # Owner tag written into the bullet store by shoot() (see OWNER_*).
+    bullet_owner = OWNER_PLAYER
+    # update_ai fires only at a target within fire_cone degrees of the heading
+    # and, unless fire_range is None, closer than fire_range pixels.
+    fire_cone = 10
+    fire_range = None
+
+    def __init__(self, x, y, color, now=0):
+        self.velocity = pygame.math.Vector2(0, 0)
+        Spaceship.reset(self, x, y, color, now)
+
+    def reset(self, x, y, color, now=0):
+        # Reinitialise in place, keeping the velocity vector.
+        self.x = x
+        self.y = y
+        # Position before the last update(); the renderer interpolates from it.
+        self.prev_x = x
+        self.prev_y = y
+        self.color = color
+        self.angle = 0  # Degrees; 0 means facing right.
+        self.velocity.update(0, 0)
+        self.acceleration = 0.2
+        self.rotation_speed = 3
+        self.max_speed = 5
+        self.radius = 15
+        self.health = 100
+        self.last_shot = now
+        self.shot_cooldown = 500  # milliseconds
+        self.thrust = False
+
+    def update(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.x += self.velocity.x
+        self.y += self.velocity.y
+        self.velocity *= 0.99
+        # Stop at the world's edges.
+        if self.x > WORLD_WIDTH or self.x < 0:
+            self.x = min(max(self.x, 0), WORLD_WIDTH)
+            self.velocity.x = 0
+        if self.y > WORLD_HEIGHT or self.y < 0:
+            self.y = min(max(self.y, 0), WORLD_HEIGHT)
+            self.velocity.y = 0
+
+    def aims_at(self, x, y):
+        # The aiming half of update_ai's fire condition, for a target at (x, y).
+        dx = x - self.x
+        dy = y - self.y
+        if self.fire_range is not None and dx * dx + dy * dy >= self.fire_range * self.fire_range:
+            return False
+        angle_diff = (math.degrees(math.atan2(-dy, dx)) - self.angle + 180) % 360 - 180
+        return abs(angle_diff) < self.fire_cone
+
+    def get_state(self):
+        # Every slot as plain data, in Spaceship.__slots__ order (for replays).
+        return [[self.velocity.x, self.velocity.y] if name == "velocity" else getattr(self, name)
+                for name in Spaceship.__slots__]
+
+    def set_state(self, state):
+        for name, value in zip(Spaceship.__slots__, state):
+            if name == "velocity":
+                self.velocity.update(value)
+            elif name == "color":
+                self.color = tuple(value)
+            else:
+                setattr(self, name, value)
+
+    def render_position(self, alpha):
+        # Position `alpha` (0..1) of the way from the previous tick to this one.
+        if alpha >= 1:
+            return self.x, self.y
+        dx = self.x - self.prev_x
+        dy = self.y - self.prev_y
+        return self.prev_x + dx * alpha, self.prev_y + dy * alpha
+
+    def can_shoot(self, now):
+        if now - self.last_shot >= self.shot_cooldown:
+            self.last_shot = now
+            return True
+        return False
+
+    def shoot(self, bullets, now):
+        direction = pygame.math.Vector2(1, 0).rotate(-self.angle)
+        bullet_velocity = self.velocity + direction * 10
+        bullets.spawn(self.x, self.y, bullet_velocity.x, bullet_velocity.y, self.color,
+                      self.bullet_owner, now)
+
+class AI_Chaser(Spaceship):
+    __slots__ = ()
+    bullet_owner = OWNER_ENEMY
+
+    def __init__(self, x, y, color, now=0):
+        super().__init__(x, y, color, now)
+        self.shot_cooldown = 1000
+
+    def update_ai(self, target, bullets, now):
+        direction = pygame.math.Vector2(target.x - self.x, target.y - self.y)
+        desired_angle = math.degrees(math.atan2(-direction.y, direction.x))
+        angle_diff = (desired_angle - self.angle + 180) % 360 - 180
+        if angle_diff > 0:
+            self.angle += min(self.rotation_speed, angle_diff)
+        else:
+            self.angle += max(-self.rotation_speed, angle_diff)
+        if direction.length() > 150:
+            forward = pygame.math.Vector2(1, 0).rotate(-self.angle)
+            self.velocity += forward * self.acceleration * 0.5
+            if self.velocity.length() > self.max_speed:
+                self.velocity.scale_to_length(self.max_speed)
+        else:
+            self.velocity *= 0.95
+        if abs(angle_diff) < self.fire_cone and self.can_shoot(now):
+            self.shoot(bullets, now)
+
+class AI_Sniper(Spaceship):
+    __slots__ = ()
+    bullet_owner = OWNER_ENEMY
+    fire_cone = 15
+
+    def __init__(self, x, y, color, now=0):
+        super().__init__(x, y, color, now)
+        self.shot_cooldown = 1500
+
+    def update_ai(self, target, bullets, now):
+        direction = pygame.math.Vector2(target.x - self.x, target.y - self.y)
+        distance = direction.length()
+        desired_angle = math.degrees(math.atan2(-direction.y, direction.x))
+        angle_diff = (desired_angle - self.angle + 180) % 360 - 180
+        if distance < 200:
+            if direction.length() != 0:
+                self.velocity += (-direction).normalize() * self.acceleration
+        elif distance > 500:
+            if direction.length() != 0:
+                self.velocity += direction.normalize() * self.acceleration
+        else:
+            if direction.length() != 0:
+                perp = pygame.math.Vector2(-direction.y, direction.x).normalize()
+                self.velocity += perp * (self.acceleration * 0.5)
+        if self.velocity.length() > self.max_speed:
+            self.velocity.scale_to_length(self.max_speed)
+        if angle_diff > 0:
+            self.angle += min(self.rotation_speed, angle_diff)
+        else:
+            self.angle += max(-self.rotation_speed, angle_diff)
+        if abs(angle_diff) < self.fire_cone and self.can_shoot(now):
+            self.shoot(bullets, now)
+
+# Drones hold on to a target until it dies, moves out of range or
+# DRONE_RETARGET_INTERVAL has passed, and only then look up the nearest enemy
+# again, through the Simulation's per-tick spatial index when one is given. Out
+# of range means beyond DRONE_TARGET_RANGE, or beyond the distance at which it
+# was picked if that was further: a far target is still chased, as long as the
+# drone keeps gaining on it.
+DRONE_TARGET_RANGE = 400        # pixels
+DRONE_RETARGET_INTERVAL = 250   # milliseconds
+
+class Drone(Spaceship):
+    __slots__ = ("player", "target", "target_leash", "retarget_time")
+    bullet_owner = OWNER_DRONE
+    fire_range = 200
+
+    def __init__(self, x, y, player, now=0):
+        super().__init__(x, y, CYAN, now)
+        self._arm(player, now)
+
+    def reset(self, x, y, player, now=0):
+        super().reset(x, y, CYAN, now)
+        self._arm(player, now)
+
+    def _arm(self, player, now):
+        self.player = player
+        self.health = 50
+        self.max_speed = 6
+        self.acceleration = 0.3
+        self.rotation_speed = 4
+        self.radius = 10
+        self.shot_cooldown = 800
+        self.target = None
+        self.target_leash = 0.0  # Squared distance at which the target is dropped.
+        self.retarget_time = now
+
+    def keeps_target(self, now):
+        if now >= self.retarget_time:
+            return False
+        target = self.target
+        if target is None:
+            return True  # Nothing to chase; wait for the next look-up.
+        dx = target.x - self.x
+        dy = target.y - self.y
+        return target.health > 0 and dx * dx + dy * dy <= self.target_leash
+
+    def find_target(self, enemies, now, grid=None):
+        # grid, if given, is a SpatialHash holding `enemies`.
+        if grid is not None:
+            found = grid.nearest(self.x, self.y)
+            target = found[1] if found else None
+        elif enemies:
+            target = min(enemies, key=lambda enemy: math.hypot(enemy.x - self.x, enemy.y - self.y))
+        else:
+            target = None
+        self.target = target
+        self.retarget_time = now + DRONE_RETARGET_INTERVAL
+        if target is not None:
+            dx = target.x - self.x
+            dy = target.y - self.y
+            self.target_leash = max(DRONE_TARGET_RANGE * DRONE_TARGET_RANGE, dx * dx + dy * dy)
+        return target
+
+    def update_ai(self, enemies, bullets, now):
+        if self.keeps_target(now):
+            target = self.target
+        else:
+            target = self.find_target(enemies, now)
+        has_target = target is not None
+        if not has_target:
+            target = self.player
+        direction = pygame.math.Vector2(target.x - self.x, target.y - self.y)
+        desired_angle = math.degrees(math.atan2(-direction.y, direction.x))
+        angle_diff = (desired_angle - self.angle + 180) % 360 - 180
+        if angle_diff > 0:
+            self.angle += min(self.rotation_speed, angle_diff)
+        else:
+            self.angle += max(-self.rotation_speed, angle_diff)
+        if direction.length() > 50:
+            forward = pygame.math.Vector2(1, 0).rotate(-self.angle)
+            self.velocity += forward * self.acceleration
+            if self.velocity.length() > self.max_speed:
+                self.velocity.scale_to_length(self.max_speed)
+        else:
+            self.velocity *= 0.95
+        if (has_target and abs(angle_diff) < self.fire_cone and direction.length() < self.fire_range
+                and self.can_shoot(now)):
+            self.shoot(bullets, now)
+
+# ---------------- Drone Pool -----------------
+# Free list of Drone objects, allocated up front. spawn() reuses a free drone
+# (a hit) or constructs one when the list is empty (a miss); release() takes
+# back destroyed drones, keeping at most `capacity` of them.
+DRONE_POOL_CAPACITY = 30
+
+class DronePool:
+    def __init__(self, capacity=DRONE_POOL_CAPACITY):
+        self.capacity = capacity
+        self.free = [Drone(0, 0, None) for _ in range(capacity)]
+        self.hits = 0
+        self.misses = 0
+
+    def spawn(self, x, y, player, now=0):
+        if self.free:
+            self.hits += 1
+            drone = self.free.pop()
+            drone.reset(x, y, player, now)
+            return drone
+        self.misses += 1
+        return Drone(x, y, player, now)
+
+    def release(self, drones):
+        free = self.free
+        for drone in drones:
+            if len(free) >= self.capacity:
+                break
+            drone.player = drone.target = None
+            free.append(drone)
+
+# ---------------- Spawn Enemies with Mode-Based Aggression -----------------
+# rng is the owning game's random.Random (the module works too); tuning sets the
+# wave sizes and base cooldowns. Enemies appear on the world's edges; a spot
+# closer than SPAWN_CLEARANCE to `origin` (normally the player) is moved to the
+# opposite edge, so a wave never lands on top of a player hugging an edge.
+SPAWN_CLEARANCE = 600
+
+def _edge_position(rng, origin):
+    side = rng.choice(['top', 'bottom', 'left', 'right'])
+    if side == 'top':
+        x, y = rng.randint(0, WORLD_WIDTH), 0
+    elif side == 'bottom':
+        x, y = rng.randint(0, WORLD_WIDTH), WORLD_HEIGHT
+    elif side == 'left':
+        x, y = 0, rng.randint(0, WORLD_HEIGHT)
+    else:
+        x, y = WORLD_WIDTH, rng.randint(0, WORLD_HEIGHT)
+    if origin is not None and math.hypot(x - origin[0], y - origin[1]) < SPAWN_CLEARANCE:
+        if side in ('top', 'bottom'):
+            y = WORLD_HEIGHT - y
+        else:
+            x = WORLD_WIDTH - x
+    return x, y
+
+def spawn_enemies(wave, aggression=1.0, now=0, rng=random, tuning=DEFAULT_TUNING, origin=None):
+    enemies = []
+    num_chasers = int(tuning.chasers_base + tuning.chasers_per_wave * wave)
+    num_snipers = max(1, int(tuning.snipers_base + tuning.snipers_per_wave * wave))
+    for _ in range(num_chasers):
+        x, y = _edge_position(rng, origin)
+        enemy = AI_Chaser(x, y, RED, now)
+        # Modify enemy parameters based on aggression factor.
+        enemy.acceleration *= aggression
+        enemy.rotation_speed *= aggression
+        enemy.shot_cooldown = int(tuning.chaser_cooldown / aggression)
+        enemies.append(enemy)
+    for _ in range(num_snipers):
+        x, y = _edge_position(rng, origin)
+        enemy = AI_Sniper(x, y, GREEN, now)
+        enemy.acceleration *= aggression
+        enemy.rotation_speed *= aggression
+        enemy.shot_cooldown = int(tuning.sniper_cooldown / aggression)
+        enemies.append(enemy)
+    return enemies
@@ -0,0 +1,448 @@
+import argparse
+import os
+import random
+import time
+from time import perf_counter
+
+import pygame
+
+from .config import (WIDTH, HEIGHT, FPS, MAX_CATCH_UP_STEPS, BLACK, WHITE, YELLOW, RED,
+                     GREEN, CYAN, BLUE, MODE_AGGRESSION)
+from .ai import AI_BUDGET_MS
+from .camera import Camera
+from .db import ScoreStore
+from .dirty import DirtyRenderer
+from .effects import bake_effects
+from .memory import AllocationTracker, GCMonitor, ManagedGC
+from .profiler import FrameProfiler, CsvFrameDump, draw_profiler_overlay, entity_counts
+from .quality import QualityGovernor, HEALTH_BAR_RADIUS
+from .replay import ReplayWriter
+from .simulation import Simulation, SimInput
+from .startup import StartupProfile, AssetLoader
+from .sprites import ship_sprites
+from .starfield import Starfield
+from .telemetry import TelemetryWriter, START
+from .text import get_font, render_text, HudLabel
+
+# ---------------- Rendering -----------------
+# Every draw function takes an optional `dirty` list and appends the rect of
+# everything it draws (see eve.dirty.DirtyRenderer).
+def _blit(screen, surface, pos, dirty):
+    rect = screen.blit(surface, pos)
+    if dirty is not None:
+        dirty.append(rect)
+
+# Health bar geometry per ship class: width, height, offset above the centre
+# and the health a full bar stands for.
+SHIP_BAR = (40, 5, 30, 100)
+DRONE_BAR = (30, 4, 25, 50)
+
+def follow_player(sim, alpha, camera=None):
+    # The camera for this frame, centred on the player's drawn position.
+    if camera is None:
+        camera = Camera()
+    camera.follow(*sim.player.render_position(alpha))
+    return camera
+
+def _draw_ships(screen, ships, camera, alpha, bar, dirty, flames=True, bar_near=None):
+    # Sprite plus health bar for every ship in view. bar_near: (x, y, squared
+    # distance); ships farther than that from world point (x, y) get no bar.
+    bar_width, bar_height, bar_offset, max_health = bar
+    for ship in ships:
+        pos = camera.to_screen(*ship.render_position(alpha))
+        if pos is None:
+            continue
+        sx, sy = pos
+        rect = ship_sprites.draw(screen, ship, sx, sy, flames)
+        if dirty is not None:
+            dirty.append(rect)
+        if bar_near is not None:
+            nx, ny, reach = bar_near
+            if (ship.x - nx) ** 2 + (ship.y - ny) ** 2 > reach:
+                continue
+        x = int(sx - bar_width / 2)
+        y = int(sy - bar_offset)
+        rect = pygame.draw.rect(screen, RED, (x, y, bar_width, bar_height))
+        pygame.draw.rect(screen, GREEN, (x, y, int(bar_width * (ship.health / max_health)), bar_height))
+        if dirty is not None:
+            dirty.append(rect)
+
+def draw_world(screen, sim, dirty=None, alpha=1.0, quality=None, camera=None):
+    # alpha: fraction of a tick elapsed since the last Simulation.step(); moving
+    # things are drawn that far between their previous and current positions.
+    # quality: an eve.quality.QualityGovernor whose switches drop optional
+    # detail; None draws everything. camera: the view to draw (see
+    # eve.camera); None follows the player.
+    if camera is None:
+        camera = follow_player(sim, alpha)
+    flames = quality is None or quality.thruster_flames
+    player = sim.player
+    bar_near = None
+    if quality is not None and not quality.distant_health_bars:
+        bar_near = (player.x, player.y, HEALTH_BAR_RADIUS * HEALTH_BAR_RADIUS)
+    _draw_ships(screen, (player,), camera, alpha, SHIP_BAR, dirty, flames)
+    _draw_ships(screen, sim.enemies, camera, alpha, SHIP_BAR, dirty, flames, bar_near)
+    _draw_ships(screen, sim.drones, camera, alpha, DRONE_BAR, dirty, flames)
+    sim.bullets.draw(screen, dirty, alpha, camera)
+    sim.enemy_bullets.draw(screen, dirty, alpha, camera)
+    sim.explosions.draw(screen, dirty, quality is None or quality.explosion_alpha, camera)
+
+class Hud:
+    # In-game HUD lines; each label re-renders only when its value changes.
+    def __init__(self):
+        self.score = HudLabel("Score: {}", 24, WHITE)
+        self.wave = HudLabel("Wave: {}", 24, WHITE)
+        self.health = HudLabel("Player Health: {}", 24, WHITE)
+        self.tokens = HudLabel("Tokens: {}", 24, WHITE)
+
+    def draw(self, screen, sim, dirty=None, alpha=1.0, camera=None):
+        player = sim.player
+        _blit(screen, self.score.update(sim.score), (10, 10), dirty)
+        _blit(screen, self.wave.update(sim.wave), (10, 30), dirty)
+        _blit(screen, self.health.update(player.health), (10, 50), dirty)
+        _blit(screen, self.tokens.update(sim.tokens), (10, 70), dirty)
+        if sim.force_field_active:
+            x, y = (camera or follow_player(sim, alpha)).to_screen(*player.render_position(alpha))
+            rect = pygame.draw.circle(screen, BLUE, (int(x), int(y)), player.radius + 15, 2)
+            if dirty is not None:
+                dirty.append(rect)
+
+def draw_playing(screen, sim, hud, dirty=None, alpha=1.0, quality=None, camera=None):
+    camera = follow_player(sim, alpha, camera)
+    draw_world(screen, sim, dirty, alpha, quality, camera)
+    hud.draw(screen, sim, dirty, alpha, camera)
+
+TEXT_BOX_RECT = pygame.Rect(WIDTH//2 - 150, HEIGHT//2 - 60, 300, 40)
+PLAY_BUTTON_RECT = pygame.Rect(WIDTH//2 - 75, HEIGHT//2 + 80, 150, 50)
+
+def draw_start_screen(screen, player_name, selected_mode, high_scores, dirty=None):
+    title_text = render_text("Advanced EVE-Style Space Combat", 48, YELLOW)
+    _blit(screen, title_text, (WIDTH//2 - title_text.get_width()//2, HEIGHT//2 - 180), dirty)
+
+    label_text = render_text("Enter your name:", 36, WHITE)
+    _blit(screen, label_text, (WIDTH//2 - label_text.get_width()//2, HEIGHT//2 - 110), dirty)
+    rect = pygame.draw.rect(screen, WHITE, TEXT_BOX_RECT, 2)
+    if dirty is not None:
+        dirty.append(rect)
+    name_surface = render_text(player_name, 36, WHITE)
+    _blit(screen, name_surface, (TEXT_BOX_RECT.x + 5, TEXT_BOX_RECT.y + 5), dirty)
+
+    mode_display = render_text("Press 1 for Standard, 2 for Less Aggressive", 36, WHITE)
+    _blit(screen, mode_display, (WIDTH//2 - mode_display.get_width()//2, HEIGHT//2 - 10), dirty)
+    current_mode = render_text("Current Mode: " + ("Standard" if selected_mode == 1 else "75% Less Aggressive"), 36, WHITE)
+    _blit(screen, current_mode, (WIDTH//2 - current_mode.get_width()//2, HEIGHT//2 + 30), dirty)
+
+    rect = pygame.draw.rect(screen, GREEN, PLAY_BUTTON_RECT)
+    if dirty is not None:
+        dirty.append(rect)
+    play_text = render_text("Play", 36, BLACK)
+    _blit(screen, play_text, (PLAY_BUTTON_RECT.x + (PLAY_BUTTON_RECT.width - play_text.get_width())//2,
+                              PLAY_BUTTON_RECT.y + (PLAY_BUTTON_RECT.height - play_text.get_height())//2),
+          dirty)
+
+    score_title = render_text("High Scores:", 28, GREEN)
+    _blit(screen, score_title, (WIDTH//2 - score_title.get_width()//2, HEIGHT//2 + 150), dirty)
+    for idx, (name, score_val) in enumerate(high_scores):
+        hs_text = render_text(f"{idx+1}. {name} - {score_val}", 28, GREEN)
+        _blit(screen, hs_text, (WIDTH//2 - hs_text.get_width()//2, HEIGHT//2 + 180 + idx * 30), dirty)
+
+def draw_game_over(screen, dirty=None):
+    over_text = render_text("GAME OVER", 48, RED)
+    instr_text = render_text("Press R to Restart or Q to Quit", 48, RED)
+    _blit(screen, over_text, (WIDTH//2 - over_text.get_width()//2, HEIGHT//2 - 60), dirty)
+    _blit(screen, instr_text, (WIDTH//2 - instr_text.get_width()//2, HEIGHT//2), dirty)
+
+# ---------------- Startup Assets -----------------
+# Every font the game renders with, as (size, name) for get_font(), and every
+# ship look as (color, radius, thrust) for the sprite cache; both are loaded
+# before the first frame.
+FONTS = ((24, None), (28, None), (36, None), (48, None), (12, "monospace"))
+SHIP_LOOKS = ((YELLOW, 15, False), (YELLOW, 15, True), (RED, 15, False), (GREEN, 15, False),
+              (CYAN, 10, False))
+
+# ---------------- Main Game Loop -----------------
+# The interactive front end: turns pygame events into SimInput and draws the
+# result. The Simulation advances in fixed ticks of sim.tick_ms: each frame's
+# elapsed time goes into an accumulator that is drained one tick at a time (at
+# most MAX_CATCH_UP_STEPS per frame, after which the game slows down rather than
+# spiralling), and the leftover fraction of a tick interpolates what is drawn.
+# Game speed therefore no longer depends on how fast frames are rendered.
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m eve")
+    parser.add_argument("--profile-csv", metavar="PATH",
+                        help="dump per-frame phase timings and entity counts to a CSV file")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="repaint and present only changed regions (for software rendering)")
+    parser.add_argument("--max-fps", type=int, default=FPS, metavar="N",
+                        help=f"cap the render rate (default {FPS}; 0 renders as fast as possible)")
+    parser.add_argument("--record-dir", metavar="DIR",
+                        help="record a replay of every game into this directory (see eve.replay)")
+    parser.add_argument("--telemetry-dir", metavar="DIR",
+                        help="log gameplay events (kills, tokens, force fields, drones, waves) "
+                             "into this directory (see eve.telemetry)")
+    parser.add_argument("--ai-budget", type=float, metavar="MS",
+                        help=f"time-slice drones and unbatched enemies far from the player once the "
+                             f"AI takes more than MS milliseconds per tick, e.g. {AI_BUDGET_MS} (off by default "
+                             f"and while recording; makes games non-deterministic)")
+    parser.add_argument("--quality", default="auto", choices=["auto"] + [str(n) for n in range(5)],
+                        help="effects quality level: auto adapts to the frame time (default), "
+                             "0 keeps every effect, 1-4 drop progressively more (see eve.quality)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print how long each startup step took, up to the first frame")
+    parser.add_argument("--alloc-report", metavar="DIR",
+                        help="trace allocations per frame and phase, and log every GC pause, "
+                             "into this directory (slow; see eve.memory)")
+    parser.add_argument("--gc", choices=("default", "managed"), default="default",
+                        help="managed: freeze startup state and collect garbage only at wave "
+                             "transitions and on menu screens")
+    args = parser.parse_args(argv)
+    # Time-sliced AI depends on timing, which a replay cannot reproduce.
+    ai_budget = None if args.record_dir else args.ai_budget
+    if args.record_dir:
+        os.makedirs(args.record_dir, exist_ok=True)
+    recorder = None
+    telemetry = TelemetryWriter(args.telemetry_dir) if args.telemetry_dir else None
+
+    # Frame profiler: F3 toggles the overlay.
+    profiler = FrameProfiler()
+    if args.profile_csv:
+        profiler.listeners.append(CsvFrameDump(args.profile_csv))
+    # Phases are timed through `timing`: the profiler, or the allocation tracker
+    # wrapping it.
+    timing = profiler
+    gc_log = None
+    if args.alloc_report:
+        timing = AllocationTracker(profiler, args.alloc_report)
+        profiler.listeners.append(timing)
+        gc_log = os.path.join(args.alloc_report, "gc.log")
+    gc_monitor = GCMonitor(profiler, gc_log)
+    managed_gc = ManagedGC() if args.gc == "managed" else None
+    gc_wave = None          # Wave seen last frame, for collecting at transitions.
+    menu_collected = False  # Whether this menu visit has been collected yet.
+    hud = Hud()
+    adaptive = args.quality == "auto"
+    quality = QualityGovernor(target_fps=args.max_fps or FPS,
+                              level=0 if adaptive else int(args.quality), adaptive=adaptive)
+
+    # Startup: only the display and font modules are initialized (no audio,
+    # joystick...). The score database and fonts load on a background thread
+    # while the window comes up and the render caches are baked; the first
+    # frame waits for them.
+    startup = StartupProfile() if args.startup_profile else None
+    pygame.font.init()
+    loader = AssetLoader(ScoreStore, FONTS, get_font).start()
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Advanced EVE-Style Space Combat")
+    clock = pygame.time.Clock()
+    if startup:
+        startup.mark("display")
+    bake_effects()
+    if startup:
+        startup.mark("effects")
+    starfield = Starfield()
+    starfield.set_near_density(quality.near_star_density)
+    if startup:
+        startup.mark("starfield")
+    for look in SHIP_LOOKS:
+        ship_sprites.warm(*look)
+    if startup:
+        startup.mark("ship sprites")
+    renderer = DirtyRenderer(screen, enabled=args.dirty_rects)
+    camera = Camera()
+    scores = loader.wait()
+    if startup:
+        startup.mark("wait for loader")
+
+    if managed_gc is not None:
+        managed_gc.start()
+
+    # States: "start", "playing", "game_over"
+    state = "start"
+    player_name = ""  # Name entered by the player.
+    # selected_mode: 1 = Standard, 2 = Less Aggressive (75% less aggression)
+    selected_mode = 1
+    score_saved = False  # To avoid multiple score saves.
+    text_box_active = False  # Whether the text box is active
+    sim = Simulation()
+    accumulator = 0.0  # Elapsed ms not yet simulated.
+    alpha = 1.0        # Fraction of a tick to interpolate drawing by.
+    # Key presses wait here until a tick consumes them, so none are lost on
+    # frames that run no tick.
+    deploy_drones = False
+    force_field = False
+
+    running = True
+    while running:
+        dt = clock.tick(args.max_fps)
+        # Only gameplay frames steer the effects quality level.
+        if state == "playing" and quality.update(dt, clock.get_rawtime()):
+            starfield.set_near_density(quality.near_star_density)
+            renderer.invalidate()
+        profiling = profiler.active
+        mark = perf_counter() if profiling else None
+        gc_monitor.set_active(profiling or gc_log is not None)
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.overlay_visible = not profiler.overlay_visible
+
+            if state == "start":
+                if event.type == pygame.MOUSEBUTTONUP:
+                    mouse_pos = event.pos
+                    if TEXT_BOX_RECT.collidepoint(mouse_pos):
+                        text_box_active = True
+                    else:
+                        text_box_active = False
+                    if PLAY_BUTTON_RECT.collidepoint(mouse_pos):
+                        if player_name == "":
+                            player_name = "Player"
+                        # Seeded, so a recorded game can be replayed exactly.
+                        sim = Simulation(aggression=MODE_AGGRESSION[selected_mode],
+                                         seed=random.randrange(2**32), ai_budget_ms=ai_budget)
+                        if args.record_dir:
+                            name = time.strftime("replay-%Y%m%d-%H%M%S.evr")
+                            recorder = ReplayWriter(os.path.join(args.record_dir, name), sim)
+                        if telemetry is not None:
+                            sim.events = telemetry.events
+                            sim.events.append((START, sim.ticks, sim.seed, sim.aggression))
+                        accumulator = 0.0
+                        deploy_drones = force_field = False
+                        score_saved = False
+                        state = "playing"
+                if event.type == pygame.KEYDOWN:
+                    # Mode selection.
+                    if event.key == pygame.K_1:
+                        selected_mode = 1
+                    elif event.key == pygame.K_2:
+                        selected_mode = 2
+                    if text_box_active:
+                        if event.key == pygame.K_BACKSPACE:
+                            player_name = player_name[:-1]
+                        else:
+                            if event.unicode.isprintable():
+                                player_name += event.unicode
+
+            elif state == "game_over":
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_r:
+                        state = "start"
+                    elif event.key == pygame.K_q:
+                        running = False
+
+            elif state == "playing":
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_f:
+                        deploy_drones = True
+                    if event.key == pygame.K_j:
+                        force_field = True
+
+        if profiling:
+            mark = timing.lap("events", mark)
+
+        if state == "playing":
+            keys = pygame.key.get_pressed()
+            sim.timer = timing if profiling else None
+            inputs = SimInput(keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_UP],
+                              keys[pygame.K_SPACE], deploy_drones, force_field)
+            accumulator += dt
+            steps = 0
+            while accumulator >= sim.tick_ms and steps < MAX_CATCH_UP_STEPS and not sim.game_over:
+                if recorder is not None:
+                    recorder.record(inputs)
+                if profiling:
+                    timing.lap("post_step", mark)
+                sim.step(inputs)  # Times its own phases through sim.timer.
+                if profiling:
+                    mark = perf_counter()
+                starfield.scroll(sim.player.velocity)
+                accumulator -= sim.tick_ms
+                steps += 1
+                if steps == 1:
+                    # One-shot actions apply to the first tick only.
+                    inputs = inputs._replace(deploy_drones=False, force_field=False)
+                    deploy_drones = force_field = False
+            if steps == MAX_CATCH_UP_STEPS:
+                # Too far behind to catch up: drop the backlog.
+                accumulator = min(accumulator, sim.tick_ms)
+            alpha = min(1.0, accumulator / sim.tick_ms)
+            if sim.game_over:
+                state = "game_over"
+                if recorder is not None:
+                    recorder.close()
+                    recorder = None
+
+        # Managed GC: collect between waves and once per visit to a menu screen.
+        if managed_gc is not None:
+            if state == "playing":
+                if gc_wave is not None and sim.wave != gc_wave:
+                    managed_gc.collect()
+                gc_wave = sim.wave
+                menu_collected = False
+            else:
+                if not menu_collected:
+                    managed_gc.collect()
+                    menu_collected = True
+                gc_wave = None
+            managed_gc.check()
+        if profiling:
+            mark = timing.lap("post_step", mark)
+
+        # ---------------- Rendering -----------------
+        # The far star layer is opaque, so the background draw replaces
+        # screen.fill(BLACK); in dirty-rect mode only last frame's rects are
+        # repainted while the stars are still.
+        renderer.begin(starfield)
+        dirty = renderer.rects
+        if profiling:
+            mark = timing.lap("render_background", mark)
+
+        if state == "start":
+            draw_start_screen(screen, player_name, selected_mode, scores.top_scores(), dirty)
+        elif state == "playing":
+            follow_player(sim, alpha, camera)
+            draw_world(screen, sim, dirty, alpha, quality, camera)
+            if profiling:
+                mark = timing.lap("render_world", mark)
+            hud.draw(screen, sim, dirty, alpha, camera)
+        elif state == "game_over":
+            if not score_saved:
+                scores.save_score(player_name, sim.score)
+                score_saved = True
+            draw_game_over(screen, dirty)
+
+        if profiling:
+            mark = timing.lap("render_hud", mark)
+
+        if profiling and profiler.overlay_visible:
+            rect = draw_profiler_overlay(screen, profiler, get_font(12, "monospace"))
+            if dirty is not None:
+                dirty.append(rect)
+            mark = timing.lap("overlay", mark)
+
+        renderer.present()
+        if startup:
+            startup.mark("first frame")
+            for name, ms in loader.timings:
+                startup.add_background(name, ms)
+            startup.report()
+            startup = None
+        if profiling:
+            timing.lap("flip", mark)
+            counts = entity_counts(sim)
+            counts["quality"] = quality.level
+            profiler.end_frame(dt, counts)
+
+    if recorder is not None:
+        recorder.close()
+    if telemetry is not None:
+        telemetry.close()
+    for listener in profiler.listeners:
+        listener.close()
+    gc_monitor.close()
+    if managed_gc is not None:
+        managed_gc.stop()
+    scores.close()
+    pygame.quit()
@@ -0,0 +1,171 @@
+import gc
+import os
+import tracemalloc
+from time import perf_counter
+
+from .profiler import FRAME_PHASES
+
+# ---------------- Allocation Tracker -----------------
+# Instrumentation mode (python -m eve --alloc-report DIR): traces every
+# allocation with tracemalloc and writes, into DIR,
+#
+#   frames.csv  one row per frame: frame, frame_ms, the bytes still allocated at
+#               the end of the frame compared to its start, then per phase the
+#               most memory the phase held beyond what it started with. Objects
+#               created and dropped within a phase (slice copies, Vector2s,
+#               Rects, temporary surfaces) show up there even though the net
+#               change is zero.
+#   sites.txt   every SITE_INTERVAL frames, the SITE_TOP source lines whose live
+#               allocations grew the most since the previous report. These are
+#               snapshots of live memory, so a line whose objects are freed
+#               within the frame never shows here however much it allocates;
+#               the per-phase peaks in frames.csv are where that churn shows.
+#   gc.log      every garbage collection, with the frame it hit (see GCMonitor).
+#
+# The tracker stands in for the FrameProfiler as the Simulation timer and for
+# the game's lap() calls, forwarding both, so phase boundaries are the
+# profiler's. tracemalloc slows allocation down severalfold: use this to find
+# where memory churns, not to measure frame times.
+SITE_INTERVAL = 300  # frames (five seconds at 60 FPS)
+SITE_TOP = 15
+
+class AllocationTracker:
+    def __init__(self, profiler, directory, site_interval=SITE_INTERVAL, top=SITE_TOP):
+        os.makedirs(directory, exist_ok=True)
+        self.profiler = profiler
+        self.site_interval = site_interval
+        self.top = top
+        self.frames = open(os.path.join(directory, "frames.csv"), "w")
+        self.frames.write(",".join(("frame", "frame_ms", "net_bytes") + FRAME_PHASES) + "\n")
+        self.sites = open(os.path.join(directory, "sites.txt"), "w")
+        self._phases = {}
+        tracemalloc.start()
+        self._snapshot = tracemalloc.take_snapshot()
+        self._frame_start = self._base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def _sample(self, phase):
+        # Everything since the previous sample belongs to `phase`.
+        current, peak = tracemalloc.get_traced_memory()
+        phases = self._phases
+        phases[phase] = phases.get(phase, 0) + peak - self._base
+        tracemalloc.reset_peak()
+        self._base = current
+
+    def record(self, phase, seconds):
+        self.profiler.record(phase, seconds)
+        self._sample(phase)
+
+    def lap(self, phase, start):
+        now = self.profiler.lap(phase, start)
+        self._sample(phase)
+        return now
+
+    def __call__(self, frame, frame_ms, phases, counts):
+        # Profiler listener: closes the frame.
+        current = tracemalloc.get_traced_memory()[0]
+        row = [str(frame), str(frame_ms), str(current - self._frame_start)]
+        row.extend(str(self._phases[name]) if name in self._phases else "" for name in FRAME_PHASES)
+        self.frames.write(",".join(row) + "\n")
+        self._phases = {}
+        self._frame_start = current
+        if frame % self.site_interval == 0:
+            self._report_sites(frame)
+
+    def _report_sites(self, frame):
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),))
+        self.sites.write(f"frame {frame}\n")
+        for stat in snapshot.compare_to(self._snapshot, "lineno")[:self.top]:
+            self.sites.write(f"    {stat}\n")
+        self.sites.flush()
+        self._snapshot = snapshot
+
+    def close(self):
+        tracemalloc.stop()
+        self.frames.close()
+        self.sites.close()
+
+# ---------------- GC Monitor -----------------
+# Times every cyclic garbage collection through gc.callbacks. The pause is added
+# to the profiler frame as the "gc" phase (overlapping whichever phase the
+# collection interrupted) and, given a log, written there as one line per
+# collection: frame, generation, pause in ms, objects collected, uncollectable.
+# The callback is only installed while set_active(True), so a game that neither
+# profiles nor logs pays nothing per collection.
+class GCMonitor:
+    def __init__(self, profiler, log_path=None):
+        self.profiler = profiler
+        self.log = open(log_path, "w") if log_path else None
+        if self.log:
+            self.log.write("# frame generation pause_ms collected uncollectable\n")
+        self.pauses = 0
+        self._start = None
+        self._installed = False
+
+    def set_active(self, active):
+        # Install or remove the callback; cheap to call every frame.
+        if active == self._installed:
+            return
+        if active:
+            gc.callbacks.append(self._callback)
+        else:
+            gc.callbacks.remove(self._callback)
+            self._start = None
+        self._installed = active
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._start = perf_counter()
+            return
+        if self._start is None:
+            return
+        seconds = perf_counter() - self._start
+        self._start = None
+        self.pauses += 1
+        if self.profiler.active:
+            self.profiler.record("gc", seconds)
+        if self.log:
+            self.log.write(f"{self.profiler.frame + 1} {info['generation']} {seconds * 1000.0:.3f} "
+                           f"{info['collected']} {info['uncollectable']}\n")
+
+    def close(self):
+        self.set_active(False)
+        if self.log:
+            self.log.close()
+
+# ---------------- Managed GC Policy -----------------
+# python -m eve --gc managed: once startup is done, everything alive (fonts,
+# sprite and effect caches, the starfield...) is frozen out of the collector's
+# reach and automatic collection is turned off. The game then collects only
+# where a pause cannot be seen: at wave transitions and on the menu screens.
+# If a long wave piles up more than `safety` container allocations, a cheap
+# young-generation collection runs anyway, so memory cannot grow unchecked.
+GC_SAFETY_ALLOCATIONS = 100000
+
+class ManagedGC:
+    def __init__(self, safety=GC_SAFETY_ALLOCATIONS):
+        self.safety = safety
+        self.collections = 0
+        self.forced = 0
+
+    def start(self):
+        # Call once startup is done.
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+
+    def collect(self):
+        # At a wave transition or on a menu screen.
+        gc.collect()
+        self.collections += 1
+
+    def check(self):
+        # Once per frame: the safety valve.
+        if gc.get_count()[0] > self.safety:
+            gc.collect(0)
+            self.forced += 1
+
+    def stop(self):
+        gc.enable()
+        gc.unfreeze()
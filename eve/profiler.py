@@ -0,0 +1,166 @@
+import csv
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+from .config import WIDTH, FPS, WHITE, YELLOW, RED, GREEN, CYAN
+from .simulation import PHASES
+
+# ---------------- Frame Profiler -----------------
+# Collects per-phase costs for every frame: the Simulation phases arrive through
+# the Simulation.timer hook (record), the front end times its own sections with
+# lap(). end_frame() closes the frame, keeps a rolling window for the overlay and
+# hands the frame to every listener, e.g. a CsvFrameDump.
+#
+# When neither the overlay nor a listener is active the game does not time
+# anything, so the profiler costs nothing until F3 is pressed.
+PROFILER_WINDOW = 240  # frames kept for the overlay (4 seconds at 60 FPS)
+# "post_step" is the front end's work around the ticks: replay recording and
+# keyframes, starfield scrolling and the managed GC.
+RENDER_PHASES = ("events", "post_step", "render_background", "render_world", "render_hud",
+                 "overlay", "flip")
+# "gc" is time spent in cyclic garbage collection (eve.memory.GCMonitor); it
+# overlaps the phase the collection interrupted.
+FRAME_PHASES = PHASES + RENDER_PHASES + ("gc",)
+# "quality" is the effects quality level (eve.quality), added by the game.
+COUNT_FIELDS = ("bullets", "enemy_bullets", "enemies", "drones", "explosions", "ai_deferred",
+                "quality")
+
+def entity_counts(sim):
+    return {
+        "bullets": len(sim.bullets),
+        "enemy_bullets": len(sim.enemy_bullets),
+        "enemies": len(sim.enemies),
+        "drones": len(sim.drones),
+        "explosions": len(sim.explosions),
+        "ai_deferred": sim.ai_deferred,
+    }
+
+class FrameProfiler:
+    def __init__(self, window=PROFILER_WINDOW):
+        self.window = window
+        self.frame = 0
+        self.frame_times = deque(maxlen=window)
+        self.phase_history = {}
+        self.counts = {}
+        self.listeners = []  # Called as listener(frame, frame_ms, phases_ms, counts).
+        self.overlay_visible = False
+        self._current = {}
+
+    @property
+    def active(self):
+        return self.overlay_visible or bool(self.listeners)
+
+    def record(self, phase, seconds):
+        current = self._current
+        current[phase] = current.get(phase, 0.0) + seconds * 1000.0
+
+    def lap(self, phase, start):
+        # Record the time since `start` under `phase`; returns the new start.
+        now = perf_counter()
+        self.record(phase, now - start)
+        return now
+
+    def end_frame(self, frame_ms, counts):
+        phases = self._current
+        self._current = {}
+        self.frame += 1
+        self.frame_times.append(frame_ms)
+        for name, ms in phases.items():
+            history = self.phase_history.get(name)
+            if history is None:
+                history = self.phase_history[name] = deque(maxlen=self.window)
+            history.append(ms)
+        self.counts = counts
+        for listener in self.listeners:
+            listener(self.frame, frame_ms, phases, counts)
+
+    def mean(self, phase):
+        history = self.phase_history.get(phase)
+        return sum(history) / len(history) if history else 0.0
+
+    def peak(self, phase):
+        history = self.phase_history.get(phase)
+        return max(history) if history else 0.0
+
+class CsvFrameDump:
+    # Profiler listener writing one CSV row per frame: frame number, frame time,
+    # every phase in FRAME_PHASES (ms, blank when the phase did not run) and the
+    # entity counts (count_* columns).
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(("frame", "frame_ms") + FRAME_PHASES
+                             + tuple("count_" + name for name in COUNT_FIELDS))
+
+    def __call__(self, frame, frame_ms, phases, counts):
+        row = [frame, frame_ms]
+        row.extend(f"{phases[name]:.4f}" if name in phases else "" for name in FRAME_PHASES)
+        row.extend(counts.get(name, "") for name in COUNT_FIELDS)
+        self.writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+# ---------------- Profiler Overlay -----------------
+OVERLAY_WIDTH = 260
+OVERLAY_GRAPH_HEIGHT = 60
+OVERLAY_LINE = 14
+FRAME_BUDGET_MS = 1000 / FPS
+
+_panels = {}  # Panel height -> translucent backdrop, built on first use.
+
+def _overlay_panel(height):
+    panel = _panels.get(height)
+    if panel is None:
+        panel = _panels[height] = pygame.Surface((OVERLAY_WIDTH, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+    return panel
+
+def draw_profiler_overlay(surface, profiler, font):
+    x = WIDTH - OVERLAY_WIDTH - 10
+    y = 10
+    height = OVERLAY_GRAPH_HEIGHT + OVERLAY_LINE * (len(FRAME_PHASES) + 5) + 12
+    panel_rect = surface.blit(_overlay_panel(height), (x, y))
+
+    # Rolling frame-time graph: one column per frame, scaled so 2x the budget
+    # fills the graph; the cyan line marks the 60 FPS budget.
+    frames = profiler.frame_times
+    scale = OVERLAY_GRAPH_HEIGHT / (FRAME_BUDGET_MS * 2)
+    bottom = y + 4 + OVERLAY_GRAPH_HEIGHT
+    column = OVERLAY_WIDTH / profiler.window
+    for i, ms in enumerate(frames):
+        bar = min(OVERLAY_GRAPH_HEIGHT, int(ms * scale))
+        color = GREEN if ms <= FRAME_BUDGET_MS * 1.1 else RED
+        px = x + int(i * column)
+        pygame.draw.line(surface, color, (px, bottom), (px, bottom - bar))
+    budget_y = bottom - int(FRAME_BUDGET_MS * scale)
+    pygame.draw.line(surface, CYAN, (x, budget_y), (x + OVERLAY_WIDTH - 1, budget_y))
+
+    line_y = bottom + 4
+    if frames:
+        text = f"frame {frames[-1]:5.1f} ms  avg {sum(frames) / len(frames):5.1f}  max {max(frames):5.1f}"
+    else:
+        text = "frame -"
+    surface.blit(font.render(text, True, YELLOW), (x + 4, line_y))
+    line_y += OVERLAY_LINE
+
+    # Per-phase cost: rolling mean as a bar (full width = frame budget), with
+    # mean and peak in ms.
+    for name in FRAME_PHASES:
+        mean = profiler.mean(name)
+        bar = min(OVERLAY_WIDTH - 8, int((OVERLAY_WIDTH - 8) * mean / FRAME_BUDGET_MS))
+        if bar:
+            pygame.draw.rect(surface, (60, 60, 140), (x + 4, line_y + 2, bar, OVERLAY_LINE - 4))
+        text = f"{name:<18}{mean:6.2f}{profiler.peak(name):7.2f}"
+        surface.blit(font.render(text, True, WHITE), (x + 4, line_y))
+        line_y += OVERLAY_LINE
+
+    counts = profiler.counts
+    line_y += 4
+    for fields in (COUNT_FIELDS[:2], COUNT_FIELDS[2:5], COUNT_FIELDS[5:]):
+        text = "  ".join(f"{name} {counts.get(name, 0)}" for name in fields)
+        surface.blit(font.render(text, True, GREEN), (x + 4, line_y))
+        line_y += OVERLAY_LINE
+    return panel_rect
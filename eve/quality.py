@@ -0,0 +1,80 @@
+from collections import deque
+
+from .config import FPS
+from .starfield import SPARSE_NEAR_DENSITY
+
+# ---------------- Effects Quality Governor -----------------
+# Keeps the frame rate on slow machines by shedding optional drawing work. The
+# game feeds it every frame's clock.tick() time plus clock.get_rawtime() (the
+# part of the frame spent working rather than waiting for the cap); both
+# decisions use the work time, so a low --max-fps cap is not mistaken for a
+# slow machine. When the mean work time over a rolling window exceeds the
+# budget of the target frame rate, the governor steps one level down; every
+# level turns off one more item of QUALITY_STEPS, in order. It steps back up
+# only after work time has stayed well under budget for RECOVER_FRAMES in a
+# row, so a level is not toggled back and forth.
+#
+# Consumers read the switches below; at level 0 everything is on.
+QUALITY_STEPS = ("explosion_alpha", "near_star_density", "distant_health_bars", "thruster_flames")
+QUALITY_WINDOW = 30           # frames averaged before stepping down (half a second)
+DEGRADE_THRESHOLD = 1.0       # of the frame budget, measured as work time
+RECOVER_THRESHOLD = 0.6       # of the frame budget, measured as work time
+RECOVER_FRAMES = 180          # headroom needed before stepping up (three seconds)
+HEALTH_BAR_RADIUS = 250       # Enemies farther from the player lose their bar.
+
+class QualityGovernor:
+    def __init__(self, target_fps=FPS, window=QUALITY_WINDOW, level=0, adaptive=True):
+        self.budget_ms = 1000.0 / target_fps
+        self.work_times = deque(maxlen=window)
+        self.adaptive = adaptive
+        self.level = level
+        self.changes = 0
+        self._headroom = 0  # Consecutive frames with work time under the recover threshold.
+
+    @property
+    def max_level(self):
+        return len(QUALITY_STEPS)
+
+    @property
+    def explosion_alpha(self):
+        return self.level < 1
+
+    @property
+    def near_star_density(self):
+        # Fraction of the near stars drawn.
+        return 1.0 if self.level < 2 else SPARSE_NEAR_DENSITY
+
+    @property
+    def distant_health_bars(self):
+        return self.level < 3
+
+    @property
+    def thruster_flames(self):
+        return self.level < 4
+
+    def update(self, frame_ms, work_ms=None):
+        # Record one frame; returns True when the level changed.
+        if not self.adaptive:
+            return False
+        work = frame_ms if work_ms is None else work_ms
+        times = self.work_times
+        times.append(work)
+        if work < self.budget_ms * RECOVER_THRESHOLD:
+            self._headroom += 1
+        else:
+            self._headroom = 0
+        if (len(times) == times.maxlen and self.level < self.max_level
+                and sum(times) / len(times) > self.budget_ms * DEGRADE_THRESHOLD):
+            return self._set_level(self.level + 1)
+        if self._headroom >= RECOVER_FRAMES and self.level > 0:
+            return self._set_level(self.level - 1)
+        return False
+
+    def _set_level(self, level):
+        # A fresh window and headroom count: the next step is judged on frames
+        # drawn at the new level only.
+        self.level = level
+        self.changes += 1
+        self.work_times.clear()
+        self._headroom = 0
+        return True
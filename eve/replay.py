@@ -0,0 +1,361 @@
+# ---------------- Replays -----------------
+# A replay is the game's configuration plus the SimInput of every tick; since a
+# seeded Simulation is deterministic, that reproduces the whole session.
+#
+# File layout (integers little-endian):
+#
+#     b"EVEREPLY"  u8 version  u32 header length  header (UTF-8 JSON)
+#     block*       u32 first tick  u32 tick count  u32 keyframe length
+#                  u32 inputs length  keyframe  inputs
+#
+# The header holds seed, aggression, start wave, tick length, tuning and world
+# size. Each block starts with a keyframe, Simulation.snapshot() as
+# zlib-compressed JSON taken before its first tick, followed by its ticks'
+# inputs: one bit per SimInput field (left, right, thrust, fire, deploy_drones,
+# force_field), run length encoded as (mask byte, varint run length) pairs, so
+# held keys cost a few bytes per run. Blocks are written whole, so a file cut
+# short by a crash still reads up to its last complete block.
+#
+# Replay memory-maps the file and only indexes block headers when opened;
+# seek() restores the nearest keyframe and steps forward from there.
+#
+#     python -m eve.replay FILE [--verify] [--bench] [--play] [--seek SECONDS]
+import argparse
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from time import perf_counter
+
+from .config import Tuning, TICK_RATE, WORLD_WIDTH, WORLD_HEIGHT
+from .simulation import Simulation, SimInput, PHASES
+
+MAGIC = b"EVEREPLY"
+VERSION = 2
+KEYFRAME_INTERVAL = 10 * TICK_RATE  # ticks per block
+_PREAMBLE = struct.Struct("<8sBI")
+_BLOCK = struct.Struct("<IIII")
+
+# All 64 input combinations, indexed by mask.
+_INPUTS = [SimInput(*(bool(mask >> bit & 1) for bit in range(len(SimInput._fields))))
+           for mask in range(1 << len(SimInput._fields))]
+
+def encode_input(inputs):
+    mask = 0
+    for bit, pressed in enumerate(inputs):
+        if pressed:
+            mask |= 1 << bit
+    return mask
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+def encode_runs(masks):
+    out = bytearray()
+    i = 0
+    n = len(masks)
+    while i < n:
+        mask = masks[i]
+        j = i + 1
+        while j < n and masks[j] == mask:
+            j += 1
+        out.append(mask)
+        _write_varint(out, j - i)
+        i = j
+    return bytes(out)
+
+def decode_runs(data):
+    masks = bytearray()
+    i = 0
+    n = len(data)
+    while i < n:
+        mask = data[i]
+        run = 0
+        shift = 0
+        while True:
+            i += 1
+            byte = data[i]
+            run |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        i += 1
+        masks.extend(bytes((mask,)) * run)
+    return masks
+
+# ---------------- Recording -----------------
+class ReplayWriter:
+    # Call record() with each SimInput just before passing it to sim.step().
+    def __init__(self, path, sim, keyframe_interval=KEYFRAME_INTERVAL):
+        if sim.seed is None:
+            raise ValueError("only a seeded Simulation can be recorded")
+        self.path = path
+        self.sim = sim
+        self.keyframe_interval = keyframe_interval
+        header = json.dumps({
+            "seed": sim.seed,
+            "aggression": sim.aggression,
+            "start_wave": sim.start_wave,
+            "tick_ms": sim.tick_ms,
+            "tuning": sim.tuning._asdict(),
+            "world": [WORLD_WIDTH, WORLD_HEIGHT],
+            "keyframe_interval": keyframe_interval,
+        }).encode()
+        self._file = open(path, "wb")
+        self._file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)) + header)
+        self._first_tick = None
+        self._keyframe = b""
+        self._masks = bytearray()
+
+    def record(self, inputs):
+        if self._first_tick is None or len(self._masks) >= self.keyframe_interval:
+            self._write_block()
+            self._first_tick = self.sim.ticks
+            state = json.dumps(self.sim.snapshot(), separators=(",", ":")).encode()
+            self._keyframe = zlib.compress(state)
+        self._masks.append(encode_input(inputs))
+
+    def _write_block(self):
+        if not self._masks:
+            return
+        runs = encode_runs(self._masks)
+        self._file.write(_BLOCK.pack(self._first_tick, len(self._masks), len(self._keyframe), len(runs)))
+        self._file.write(self._keyframe)
+        self._file.write(runs)
+        self._masks = bytearray()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._write_block()
+        self._file.close()
+
+# ---------------- Playback -----------------
+class Replay:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file.
+            self._file.close()
+            raise ValueError(f"{path}: not a replay")
+        data = self._map
+        if len(data) < _PREAMBLE.size:
+            self.close()
+            raise ValueError(f"{path}: not a replay")
+        magic, version, header_len = _PREAMBLE.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path}: not a version {VERSION} replay")
+        offset = _PREAMBLE.size + header_len
+        self.header = json.loads(bytes(data[_PREAMBLE.size:offset]))
+        if self.header["world"] != [WORLD_WIDTH, WORLD_HEIGHT]:
+            self.close()
+            raise ValueError(f"{path}: recorded in a {self.header['world'][0]}x"
+                             f"{self.header['world'][1]} world")
+        # Block index: (first tick, tick count, keyframe offset, keyframe
+        # length, inputs offset, inputs length).
+        self.blocks = []
+        while offset + _BLOCK.size <= len(data):
+            first_tick, count, keyframe_len, inputs_len = _BLOCK.unpack_from(data, offset)
+            keyframe_at = offset + _BLOCK.size
+            inputs_at = keyframe_at + keyframe_len
+            offset = inputs_at + inputs_len
+            if offset > len(data):
+                break  # Truncated last block.
+            self.blocks.append((first_tick, count, keyframe_at, keyframe_len, inputs_at, inputs_len))
+        self._starts = [block[0] for block in self.blocks]
+        self.ticks = self.blocks[-1][0] + self.blocks[-1][1] if self.blocks else 0
+        self._decoded = (None, None)
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    @property
+    def seed(self):
+        return self.header["seed"]
+
+    @property
+    def size(self):
+        return len(self._map)
+
+    def new_simulation(self):
+        header = self.header
+        return Simulation(aggression=header["aggression"], tick_ms=header["tick_ms"],
+                          start_wave=header["start_wave"], seed=header["seed"],
+                          tuning=Tuning(**header["tuning"]))
+
+    def keyframe(self, index):
+        _, _, at, length, _, _ = self.blocks[index]
+        return json.loads(zlib.decompress(self._map[at:at + length]))
+
+    def block_masks(self, index):
+        if self._decoded[0] != index:
+            _, _, _, _, at, length = self.blocks[index]
+            self._decoded = (index, decode_runs(self._map[at:at + length]))
+        return self._decoded[1]
+
+    def block_for(self, tick):
+        return max(0, bisect.bisect_right(self._starts, tick) - 1)
+
+    def input_at(self, tick):
+        # The SimInput fed to the tick that advanced sim.ticks from `tick`.
+        index = self.block_for(tick)
+        return _INPUTS[self.block_masks(index)[tick - self.blocks[index][0]]]
+
+    def inputs(self, start=0):
+        for index in range(self.block_for(start), len(self.blocks)):
+            first = self.blocks[index][0]
+            masks = self.block_masks(index)
+            for i in range(max(0, start - first), len(masks)):
+                yield _INPUTS[masks[i]]
+
+    def seek(self, tick, sim=None):
+        # A Simulation that has run `tick` ticks of this replay (clamped to
+        # its length). Pass `sim` to reuse an existing one.
+        tick = max(0, min(tick, self.ticks))
+        if sim is None:
+            sim = self.new_simulation()
+        if not self.blocks:
+            sim.reset()
+            return sim
+        index = self.block_for(tick)
+        sim.restore(self.keyframe(index))
+        while sim.ticks < tick:
+            sim.step(self.input_at(sim.ticks))
+        return sim
+
+# ---------------- Command Line -----------------
+def verify(replay):
+    # Replays every tick from the start and checks each keyframe; returns the
+    # first tick whose state differs, or None.
+    sim = replay.new_simulation()
+    for index, block in enumerate(replay.blocks):
+        expected = json.dumps(replay.keyframe(index), sort_keys=True)
+        if json.dumps(sim.snapshot(), sort_keys=True) != expected:
+            return block[0]
+        for inputs in replay.inputs(block[0]):
+            if sim.ticks >= block[0] + block[1]:
+                break
+            sim.step(inputs)
+    return None
+
+def bench(replay):
+    # Headless replay from the start as a deterministic performance input.
+    from .bench import PhaseRecorder, summarize
+    sim = replay.new_simulation()
+    recorder = PhaseRecorder()
+    sim.timer = recorder
+    start = perf_counter()
+    for inputs in replay.inputs():
+        tick_start = perf_counter()
+        sim.step(inputs)
+        recorder.record("tick", perf_counter() - tick_start)
+    elapsed = perf_counter() - start
+    return {"ticks": sim.ticks, "elapsed_s": elapsed,
+            "ticks_per_second": sim.ticks / elapsed if elapsed else 0.0,
+            "phases": {phase: summarize(recorder.samples[phase]) for phase in PHASES + ("tick",)}}
+
+def play(replay, start_tick):
+    # Windowed playback. Space pauses, Left/Right jump 10 seconds, Up/Down
+    # double or halve the speed, Escape quits.
+    import pygame
+    from .config import WIDTH, HEIGHT, FPS, WHITE
+    from .effects import bake_effects
+    from .game import Hud, draw_playing
+    from .starfield import Starfield
+    from .text import render_text
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption(f"Replay - {os.path.basename(replay.path)}")
+    clock = pygame.time.Clock()
+    bake_effects()
+    starfield = Starfield()
+    hud = Hud()
+    sim = replay.seek(start_tick)
+    jump = 10 * TICK_RATE
+    speed = 1.0
+    paused = False
+    accumulator = 0.0
+    running = True
+    while running:
+        dt = clock.tick(FPS)
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    step = jump if event.key == pygame.K_RIGHT else -jump
+                    sim = replay.seek(sim.ticks + step, sim)
+                    accumulator = 0.0
+                elif event.key == pygame.K_UP:
+                    speed = min(speed * 2, 32.0)
+                elif event.key == pygame.K_DOWN:
+                    speed = max(speed / 2, 0.25)
+        if not paused:
+            accumulator += dt * speed
+            while accumulator >= sim.tick_ms and sim.ticks < replay.ticks and not sim.game_over:
+                sim.step(replay.input_at(sim.ticks))
+                starfield.scroll(sim.player.velocity)
+                accumulator -= sim.tick_ms
+            accumulator = min(accumulator, sim.tick_ms)
+        starfield.draw(screen)
+        draw_playing(screen, sim, hud, alpha=accumulator / sim.tick_ms if not paused else 1.0)
+        status = (f"{sim.ticks / TICK_RATE:6.1f}s / {replay.ticks / TICK_RATE:.1f}s  x{speed:g}"
+                  f"{'  paused' if paused else ''}")
+        label = render_text(status, 24, WHITE)
+        screen.blit(label, (WIDTH - label.get_width() - 10, HEIGHT - 30))
+        pygame.display.flip()
+    pygame.quit()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m eve.replay",
+                                     description="Inspect, verify, benchmark or watch a replay.")
+    parser.add_argument("path")
+    parser.add_argument("--verify", action="store_true",
+                        help="re-simulate the whole replay and check it against every keyframe")
+    parser.add_argument("--bench", action="store_true", help="time a headless run of the replay")
+    parser.add_argument("--play", action="store_true", help="watch the replay in a window")
+    parser.add_argument("--seek", type=float, default=0.0, metavar="SECONDS",
+                        help="start playback this far into the replay")
+    args = parser.parse_args(argv)
+
+    replay = Replay(args.path)
+    try:
+        header = replay.header
+        print(f"{args.path}: {replay.ticks} ticks ({replay.ticks / TICK_RATE:.1f}s), "
+              f"{len(replay.blocks)} keyframes, {replay.size} bytes, seed {header['seed']}, "
+              f"aggression {header['aggression']}, start wave {header['start_wave']}")
+        if args.verify:
+            bad = verify(replay)
+            if bad is not None:
+                print(f"verify: state diverges at tick {bad}")
+                sys.exit(1)
+            print("verify: ok")
+        if args.play:
+            play(replay, int(args.seek * TICK_RATE))
+        if args.bench:
+            # After play(): importing eve.bench selects the dummy video driver.
+            result = bench(replay)
+            tick = result["phases"]["tick"]
+            print(f"bench: {result['ticks_per_second']:.0f} ticks/s, tick p50 {tick['p50_ms']:.3f} ms, "
+                  f"p95 {tick['p95_ms']:.3f} ms, p99 {tick['p99_ms']:.3f} ms")
+    finally:
+        replay.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+import random
+from collections import namedtuple
+from time import perf_counter
+
+import pygame
+
+from .ai import EnemyAI, AIScheduler
+from .bullets import BulletPool, OWNER_PLAYER
+from .collision import SpatialHash, resolve_bullet_hits, TARGET_CELL_SIZE
+from .config import WORLD_WIDTH, WORLD_HEIGHT, TICK_RATE, YELLOW, GREEN, FREE_FORCE_FIELDS, DEFAULT_TUNING
+from .effects import EffectPool, EXPLOSION
+from .entities import Spaceship, AI_Chaser, AI_Sniper, DronePool, spawn_enemies
+from .telemetry import KILL, TOKEN, FORCE_FIELD, DRONES, WAVE, GAME_OVER
+
+# ---------------- Simulation Input -----------------
+# One tick worth of controls. The first four are held keys; deploy_drones and
+# force_field are edge-triggered (the F / J key went down this tick).
+SimInput = namedtuple("SimInput", "left right thrust fire deploy_drones force_field",
+                      defaults=(False, False, False, False, False, False))
+IDLE_INPUT = SimInput()
+
+# ---------------- Simulation -----------------
+# Headless game state and rules. Owns every entity plus score, wave, force field
+# and tokens, and keeps its own millisecond clock, so it needs neither a display
+# nor pygame.time: step() can be driven as fast as the caller likes. Randomness
+# comes from the game's own random.Random, seeded with `seed` on every reset(),
+# so a seeded game replays exactly and games can run side by side.
+#
+# A tick runs the PHASES below in order. Setting `timer` to any object with a
+# record(phase, seconds) method times each phase with perf_counter; with the
+# default of None the only cost is one attribute check per tick. Likewise,
+# `events` may be set to any object with an append() method (normally the deque
+# of an eve.telemetry.TelemetryWriter) to receive a (kind, tick, *fields) tuple
+# for every kill, token award, force field activation, drone deployment, wave
+# transition and game over.
+#
+# ai_budget_ms turns on level-of-detail AI (see eve.ai.AIScheduler): distant
+# ships are time-sliced to keep the AI phase near that many milliseconds per
+# tick. It trades determinism for bounded tick time, so leave it off for
+# replays, sweeps and benchmarks.
+PHASES = ("player", "ai", "bullets", "collide_enemies", "collide_player",
+          "collide_drones", "explosions", "waves")
+
+class Simulation:
+    def __init__(self, aggression=1.0, tick_ms=1000 / TICK_RATE, start_wave=1, seed=None,
+                 tuning=DEFAULT_TUNING, ai_budget_ms=None):
+        self.aggression = aggression
+        self.tick_ms = tick_ms
+        self.start_wave = start_wave
+        self.seed = seed
+        self.tuning = tuning
+        self.rng = random.Random()
+        self.ai_scheduler = None
+        if ai_budget_ms:
+            self.ai_scheduler = AIScheduler(ai_budget_ms, lookahead_ms=tick_ms)
+        self.collision_grid = SpatialHash()
+        self.target_grid = SpatialHash(TARGET_CELL_SIZE)  # Enemies, for drone targeting.
+        self.timer = None
+        self.events = None
+        self._phases = [(name, getattr(self, "_" + name)) for name in PHASES]
+        self.reset()
+
+    def reset(self):
+        self.rng.seed(self.seed)
+        self.time = 0.0
+        self.ticks = 0
+        self.inputs = IDLE_INPUT
+        self.player = Spaceship(WORLD_WIDTH // 2, WORLD_HEIGHT // 2, YELLOW, self.time)
+        self.bullets = BulletPool()
+        self.enemy_bullets = BulletPool()
+        self.drones = []
+        self.drone_pool = DronePool()
+        self.enemies = self._spawn_wave(self.start_wave)
+        self.enemy_ai = EnemyAI()
+        self.explosions = EffectPool()
+        self.score = 0
+        self.wave = self.start_wave
+        self.force_field_active = False
+        self.force_field_start_time = 0
+        self.free_force_field_count = 0  # Count of free force field activations used so far
+        self.tokens = 0
+        self.tokens_earned = 0
+        self.force_fields_used = 0
+        self.game_over = False
+
+    # ---------------- Snapshots -----------------
+    # The complete game state as plain JSON-compatible data. restore() of a
+    # snapshot continues exactly as the original game would (replay keyframes).
+    # Configuration (aggression, tuning, tick_ms) is not included.
+    SCALARS = ("time", "ticks", "score", "wave", "force_field_active", "force_field_start_time",
+               "free_force_field_count", "tokens", "tokens_earned", "force_fields_used", "game_over")
+    ENEMY_TYPES = {cls.__name__: cls for cls in (AI_Chaser, AI_Sniper)}
+
+    def snapshot(self):
+        self.enemy_ai.flush()
+        enemy_index = {id(enemy): i for i, enemy in enumerate(self.enemies)}
+        drones = []
+        for drone in self.drones:
+            # -1: no target. -2: a target missing from the list, i.e. dead;
+            # lapsing the retarget time drops it at the next check just the same.
+            target = -1 if drone.target is None else enemy_index.get(id(drone.target), -2)
+            retarget_time = 0 if target == -2 else drone.retarget_time
+            drones.append([drone.get_state(), target, drone.target_leash, retarget_time])
+        state = {name: getattr(self, name) for name in self.SCALARS}
+        version, internal, gauss = self.rng.getstate()
+        state.update(
+            rng=[version, list(internal), gauss],
+            player=self.player.get_state(),
+            enemies=[[type(enemy).__name__, enemy.get_state()] for enemy in self.enemies],
+            drones=drones,
+            bullets=self.bullets.get_state(),
+            enemy_bullets=self.enemy_bullets.get_state(),
+            explosions=self.explosions.get_state(),
+        )
+        return state
+
+    def restore(self, state):
+        for name in self.SCALARS:
+            setattr(self, name, state[name])
+        version, internal, gauss = state["rng"]
+        self.rng.setstate((version, tuple(internal), gauss))
+        self.inputs = IDLE_INPUT
+        self.player = Spaceship(0, 0, YELLOW)
+        self.player.set_state(state["player"])
+        self.enemies = []
+        for kind, ship_state in state["enemies"]:
+            enemy = self.ENEMY_TYPES[kind](0, 0, YELLOW)
+            enemy.set_state(ship_state)
+            self.enemies.append(enemy)
+        self.enemy_ai = EnemyAI()
+        self.drones = []
+        for ship_state, target, leash, retarget_time in state["drones"]:
+            drone = self.drone_pool.spawn(0, 0, self.player)
+            drone.set_state(ship_state)
+            drone.target = self.enemies[target] if target >= 0 else None
+            drone.target_leash = leash
+            drone.retarget_time = retarget_time
+            self.drones.append(drone)
+        self.bullets.set_state(state["bullets"])
+        self.enemy_bullets.set_state(state["enemy_bullets"])
+        self.explosions.set_state(state["explosions"])
+
+    def _spawn_wave(self, wave):
+        # Around the player, wherever it is in the world.
+        player = self.player
+        return spawn_enemies(wave, self.aggression, self.time, self.rng, self.tuning,
+                             (player.x, player.y))
+
+    def deploy_drones(self):
+        # Deploy 3 drones.
+        player = self.player
+        for i in range(3):
+            offset_angle = i * 120
+            offset = pygame.math.Vector2(30, 0).rotate(offset_angle)
+            drone_x = player.x + offset.x
+            drone_y = player.y + offset.y
+            self.drones.append(self.drone_pool.spawn(drone_x, drone_y, player, self.time))
+        if self.events is not None:
+            self.events.append((DRONES, self.ticks, len(self.drones)))
+
+    def activate_force_field(self):
+        if self.force_field_active:
+            return False
+        # First activations are free, later ones cost a token.
+        paid = 0
+        if self.free_force_field_count < FREE_FORCE_FIELDS:
+            self.free_force_field_count += 1
+        elif self.tokens >= 1:
+            self.tokens -= 1
+            paid = 1
+        else:
+            return False
+        self.force_field_active = True
+        self.force_field_start_time = self.time
+        self.force_fields_used += 1
+        if self.events is not None:
+            self.events.append((FORCE_FIELD, self.ticks, paid, self.tokens))
+        return True
+
+    def step(self, inputs=IDLE_INPUT):
+        if self.game_over:
+            return
+        self.time += self.tick_ms
+        self.ticks += 1
+        self.inputs = inputs
+
+        if inputs.deploy_drones:
+            self.deploy_drones()
+        if inputs.force_field:
+            self.activate_force_field()
+
+        # Update force field duration.
+        if self.force_field_active and self.time - self.force_field_start_time > self.tuning.force_field_duration:
+            self.force_field_active = False
+
+        timer = self.timer
+        if timer is None:
+            for _, phase in self._phases:
+                phase()
+        else:
+            for name, phase in self._phases:
+                start = perf_counter()
+                phase()
+                timer.record(name, perf_counter() - start)
+
+    def _player(self):
+        inputs = self.inputs
+        player = self.player
+        if inputs.left:
+            player.angle += player.rotation_speed
+        if inputs.right:
+            player.angle -= player.rotation_speed
+        if inputs.thrust:
+            forward = pygame.math.Vector2(1, 0).rotate(-player.angle)
+            player.velocity += forward * player.acceleration
+            if player.velocity.length() > player.max_speed:
+                player.velocity.scale_to_length(player.max_speed)
+            player.thrust = True
+        else:
+            player.thrust = False
+        # Faster fire when holding spacebar.
+        if inputs.fire:
+            player.shot_cooldown = 250
+            if player.can_shoot(self.time):
+                player.shoot(self.bullets, self.time)
+        else:
+            player.shot_cooldown = 500
+        player.update()
+
+    @property
+    def ai_deferred(self):
+        # AI updates the scheduler skipped last tick.
+        return self.ai_scheduler.deferred if self.ai_scheduler is not None else 0
+
+    def _ai(self):
+        now = self.time
+        scheduler = self.ai_scheduler
+        if scheduler is not None:
+            scheduler.begin_tick()
+        # Update enemies (batched per type, see eve.ai).
+        self.enemy_ai.update(self.enemies, self.player, self.enemy_bullets, now, scheduler)
+
+        # Update drones. Those whose target lapsed look up a new one through an
+        # enemy index built at most once per tick.
+        stale = [drone for drone in self.drones if not drone.keeps_target(now)]
+        if stale:
+            grid = self.target_grid
+            grid.rebuild(self.enemies)
+            for drone in stale:
+                drone.find_target(self.enemies, now, grid)
+        if scheduler is None or not self.drones:
+            for drone in self.drones:
+                drone.update_ai(self.enemies, self.bullets, now)
+                drone.update()
+            return
+        player = self.player
+        start = perf_counter()
+        critical = [scheduler.is_critical(drone, player.x, player.y, now, drone.target)
+                    for drone in self.drones]
+        active = scheduler.plan("drones", critical)
+        for drone, steer in zip(self.drones, active):
+            if steer:
+                drone.update_ai(self.enemies, self.bullets, now)
+            drone.update()
+        scheduler.charge(sum(active), perf_counter() - start)
+
+    def _bullets(self):
+        self.bullets.update(self.time)
+        self.enemy_bullets.update(self.time)
+
+    def _collide_enemies(self):
+        # Collisions: Bullets vs. enemies.
+        bullets = self.bullets
+        spent, killed = resolve_bullet_hits(bullets, self.enemies, self.collision_grid, 20)
+        events = self.events
+        for enemy, row in killed:
+            self.explosions.spawn(EXPLOSION, enemy.x, enemy.y)
+            # Count score (and tokens) only if bullet from player.
+            by_player = bullets.owner[row] == OWNER_PLAYER
+            if events is not None:
+                events.append((KILL, self.ticks, type(enemy).__name__, int(by_player)))
+            if by_player:
+                self.score += 100
+                if enemy.color == GREEN:
+                    self.tokens += 1
+                    self.tokens_earned += 1
+                    if events is not None:
+                        events.append((TOKEN, self.ticks, self.tokens))
+        bullets.remove(spent)
+        if killed:
+            self.enemies = [enemy for enemy in self.enemies if enemy.health > 0]
+
+    def _collide_player(self):
+        # Collisions: Enemy bullets vs. player (or force field).
+        spent, killed = resolve_bullet_hits(self.enemy_bullets, [self.player], self.collision_grid,
+                                            0 if self.force_field_active else 10)
+        if killed:
+            self.game_over = True
+            if self.events is not None:
+                self.events.append((GAME_OVER, self.ticks, self.score, self.wave))
+        self.enemy_bullets.remove(spent)
+
+    def _collide_drones(self):
+        # Collisions: Enemy bullets vs. drones.
+        spent, killed = resolve_bullet_hits(self.enemy_bullets, self.drones, self.collision_grid, 10)
+        for drone, _ in killed:
+            self.explosions.spawn(EXPLOSION, drone.x, drone.y)
+        self.enemy_bullets.remove(spent)
+        if killed:
+            self.drone_pool.release(drone for drone, _ in killed)
+            self.drones = [drone for drone in self.drones if drone.health > 0]
+
+    def _explosions(self):
+        self.explosions.update()
+
+    def _waves(self):
+        # When all enemies are eliminated, advance to next wave.
+        if not self.enemies:
+            self.wave += 1
+            self.enemies = self._spawn_wave(self.wave)
+            if self.events is not None:
+                self.events.append((WAVE, self.ticks, self.wave, len(self.enemies)))
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+import pygame
+
+from .config import ORANGE
+
+# ---------------- Ship Polygons -----------------
+def draw_ship_polygons(surface, x, y, radius, angle, color, thrust):
+    tip = pygame.math.Vector2(radius, 0).rotate(-angle)
+    left = pygame.math.Vector2(-radius/2, radius/1.5).rotate(-angle)
+    right = pygame.math.Vector2(-radius/2, -radius/1.5).rotate(-angle)
+    p1 = (x + tip.x, y + tip.y)
+    p2 = (x + left.x, y + left.y)
+    p3 = (x + right.x, y + right.y)
+    pygame.draw.polygon(surface, color, [p1, p2, p3])
+    # Draw thruster flame.
+    if thrust:
+        flame = pygame.math.Vector2(-radius - 5, 0).rotate(-angle)
+        flame_left = pygame.math.Vector2(-radius/2 - 5, radius/3).rotate(-angle)
+        flame_right = pygame.math.Vector2(-radius/2 - 5, -radius/3).rotate(-angle)
+        f1 = (x + flame.x, y + flame.y)
+        f2 = (x + flame_left.x, y + flame_left.y)
+        f3 = (x + flame_right.x, y + flame_right.y)
+        pygame.draw.polygon(surface, ORANGE, [f1, f2, f3])
+
+# ---------------- Ship Sprite Cache -----------------
+# Ships are drawn as one blit of a pre-rendered sprite. Sprites are keyed by
+# (color, radius, thrust, quantized angle); that covers every ship class, since
+# player, AI_Chaser, AI_Sniper and Drone differ only in color and radius. They
+# are rendered on first use and kept in an LRU capped at SPRITE_CACHE_LIMIT.
+SPRITE_ANGLE_STEP = 3       # degrees
+SPRITE_CACHE_LIMIT = 1024   # sprites; about 7 KB each for a radius 15 ship
+SPRITE_COLORKEY = (255, 0, 255)  # Transparent background; no ship uses magenta.
+
+class ShipSpriteCache:
+    def __init__(self, angle_step=SPRITE_ANGLE_STEP, limit=SPRITE_CACHE_LIMIT):
+        self.angle_step = angle_step
+        self.steps = int(round(360 / angle_step))
+        self.limit = limit
+        self._sprites = OrderedDict()
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def get(self, color, radius, thrust, angle):
+        index = int(round(angle / self.angle_step)) % self.steps
+        key = (color, radius, thrust, index)
+        sprites = self._sprites
+        sprite = sprites.get(key)
+        if sprite is None:
+            # The flame reaches radius + 5 behind the centre; one pixel of slack.
+            half = int(radius) + 6
+            # Ships are solid polygons, so a colorkeyed (RLE) surface blits
+            # faster than a per-pixel alpha one.
+            sprite = pygame.Surface((half * 2, half * 2))
+            sprite.fill(SPRITE_COLORKEY)
+            draw_ship_polygons(sprite, half, half, radius, index * self.angle_step, color, thrust)
+            sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            sprites[key] = sprite
+            if len(sprites) > self.limit:
+                sprites.popitem(last=False)
+        else:
+            sprites.move_to_end(key)
+        return sprite
+
+    def warm(self, color, radius, thrust=False):
+        # Render every angle of one ship look ahead of time (at startup), so
+        # the first turn of a ship never renders sprites mid-frame.
+        for index in range(self.steps):
+            self.get(color, radius, thrust, index * self.angle_step)
+
+    def draw(self, surface, ship, x, y, flames=True):
+        # flames=False draws a thrusting ship without its thruster flame.
+        sprite = self.get(ship.color, ship.radius, ship.thrust and flames, ship.angle)
+        half = sprite.get_width() // 2
+        return surface.blit(sprite, (int(x) - half, int(y) - half))
+
+    def clear(self):
+        self._sprites.clear()
+
+ship_sprites = ShipSpriteCache()
@@ -0,0 +1,105 @@
+import random
+
+import pygame
+
+from .config import WIDTH, HEIGHT, BLACK, WHITE
+
+# ---------------- Starfield Layers -----------------
+# Each layer is rendered once into a screen-sized surface. A static layer
+# (parallax 0) is a plain blit; a scrolling layer is a seamless tile blitted at
+# most four times around an offset that drifts against the player's velocity,
+# so no star is redrawn per frame and star counts do not affect frame cost.
+# The first layer is opaque and doubles as the black background fill. Since the
+# camera follows the player (eve.camera), both layers scroll, at a fraction of
+# the player's speed, so that movement shows against them.
+#
+# The near layer also comes in a sparse variant holding every other star, which
+# the quality governor (eve.quality) switches to via set_near_density().
+NUM_STARS_FAR = 100
+NUM_STARS_NEAR = 50
+FAR_PARALLAX = 0.1
+NEAR_PARALLAX = 0.3
+SPARSE_NEAR_DENSITY = 0.5
+
+def random_stars(count):
+    return [(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(count)]
+
+class StarLayer:
+    def __init__(self, stars, radius, parallax, opaque=False):
+        self.parallax = parallax
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.surface = pygame.Surface((WIDTH, HEIGHT))
+        self.surface.fill(BLACK)
+        for x, y in stars:
+            if parallax:
+                # Repeat stars that straddle an edge on the opposite side so the
+                # tile wraps without seams.
+                for dx in (-WIDTH, 0, WIDTH):
+                    for dy in (-HEIGHT, 0, HEIGHT):
+                        pygame.draw.circle(self.surface, WHITE, (x + dx, y + dy), radius)
+            else:
+                pygame.draw.circle(self.surface, WHITE, (x, y), radius)
+        if not opaque:
+            self.surface.set_colorkey(BLACK, pygame.RLEACCEL)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+
+    def scroll(self, velocity):
+        if self.parallax:
+            self.offset_x = (self.offset_x - velocity.x * self.parallax) % WIDTH
+            self.offset_y = (self.offset_y - velocity.y * self.parallax) % HEIGHT
+
+    def draw(self, screen):
+        if not self.parallax:
+            screen.blit(self.surface, (0, 0))
+            return
+        ox = int(self.offset_x)
+        oy = int(self.offset_y)
+        for x in ((ox, ox - WIDTH) if ox else (0,)):
+            for y in ((oy, oy - HEIGHT) if oy else (0,)):
+                screen.blit(self.surface, (x, y))
+
+class Starfield:
+    def __init__(self, far=NUM_STARS_FAR, near=NUM_STARS_NEAR):
+        far_stars = random_stars(far)
+        near_stars = random_stars(near)
+        self.near_layers = {1.0: StarLayer(near_stars, 2, NEAR_PARALLAX),
+                            SPARSE_NEAR_DENSITY: StarLayer(near_stars[::2], 2, NEAR_PARALLAX)}
+        self.near_density = 1.0
+        self.layers = [StarLayer(far_stars, 1, FAR_PARALLAX, opaque=True), self.near_layers[1.0]]
+        self._drawn_at = None
+
+    def set_near_density(self, density):
+        # Swap in the near layer for `density`; it carries on from the same
+        # scroll offset. The caller repaints (the star pattern changes).
+        layer = self.near_layers[density]
+        current = self.layers[1]
+        layer.offset_x = current.offset_x
+        layer.offset_y = current.offset_y
+        self.layers[1] = layer
+        self.near_density = density
+
+    def _pixel_offsets(self):
+        return tuple((int(layer.offset_x), int(layer.offset_y)) for layer in self.layers)
+
+    def scroll(self, velocity):
+        for layer in self.layers:
+            layer.scroll(velocity)
+
+    def changed(self):
+        # True when a layer moved by at least a pixel since the last full draw.
+        return self._pixel_offsets() != self._drawn_at
+
+    def draw(self, screen):
+        for layer in self.layers:
+            layer.draw(screen)
+        self._drawn_at = self._pixel_offsets()
+
+    def restore(self, screen, rect):
+        # Repaint the background under one rect; the clip keeps each blit small.
+        clip = screen.get_clip()
+        screen.set_clip(rect)
+        for layer in self.layers:
+            layer.draw(screen)
+        screen.set_clip(clip)
@@ -0,0 +1,80 @@
+import sys
+import threading
+from time import perf_counter
+
+# ---------------- Startup Pipeline -----------------
+# Helpers for getting from `python -m eve` to the first frame quickly: the game
+# initializes only the pygame modules it uses, opens the score database and
+# loads fonts on a background AssetLoader while the window comes up, and bakes
+# its render caches before the first frame. StartupProfile times each step for
+# python -m eve --startup-profile.
+#
+# The package imports this module first, so IMPORT_START marks when loading
+# eve (and with it pygame and NumPy) began.
+IMPORT_START = perf_counter()
+
+class StartupProfile:
+    def __init__(self, started=IMPORT_START):
+        self.started = started
+        self.steps = []  # (name, ms, background)
+        self._mark = perf_counter()
+        self.steps.append(("imports", (self._mark - started) * 1000.0, False))
+
+    def mark(self, name):
+        # Close a main-thread step: the time since the previous mark.
+        now = perf_counter()
+        self.steps.append((name, (now - self._mark) * 1000.0, False))
+        self._mark = now
+
+    def add_background(self, name, ms):
+        self.steps.append((name, ms, True))
+
+    @property
+    def total_ms(self):
+        return (self._mark - self.started) * 1000.0
+
+    def report(self, out=sys.stderr):
+        # Background steps overlap the main thread; only the wait for them
+        # counts towards the total.
+        print(f"{'startup step':<28}{'ms':>9}", file=out)
+        for name, ms, background in self.steps:
+            label = f"{name} (background)" if background else name
+            print(f"  {label:<26}{ms:>9.1f}", file=out)
+        print(f"{'time to first frame':<28}{self.total_ms:>9.1f}", file=out)
+
+class AssetLoader:
+    # Runs open_scores() and loads every font in `fonts` ((size, name) pairs,
+    # see eve.text.get_font) on a thread. Font lookups scan the system font
+    # list once, which is slow on machines with many fonts; SQLite and that
+    # scan both spend their time outside the GIL.
+    def __init__(self, open_scores, fonts, get_font):
+        self.open_scores = open_scores
+        self.fonts = fonts
+        self.get_font = get_font
+        self.timings = []  # (name, ms)
+        self._scores = None
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="asset-loader", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            start = perf_counter()
+            self._scores = self.open_scores()
+            mid = perf_counter()
+            self.timings.append(("score database", (mid - start) * 1000.0))
+            for size, name in self.fonts:
+                self.get_font(size, name)
+            self.timings.append(("fonts", (perf_counter() - mid) * 1000.0))
+        except Exception as exc:  # Re-raised on the main thread by wait().
+            self._error = exc
+
+    def wait(self):
+        # Block until loading is done; returns the score store.
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._scores
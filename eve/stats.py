@@ -0,0 +1,9 @@
+# ---------------- Sample Statistics -----------------
+# Shared by eve.bench and eve.sweep. Kept free of pygame and the game modules,
+# so the headless sweep and its worker processes can import it cheaply.
+def percentile(sorted_samples, q):
+    # Nearest-rank percentile of an already sorted list.
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, int(round(q / 100.0 * len(sorted_samples))))
+    return sorted_samples[min(rank, len(sorted_samples)) - 1]
@@ -0,0 +1,166 @@
+# ---------------- Balancing Sweeps -----------------
+# Plays many seeded, bot-piloted games without a display, spread across a
+# process pool, and aggregates the outcomes per parameter set:
+#
+#     python -m eve.sweep --games 500 --aggression 1.0 0.5 0.25 \
+#         --force-field-duration 10000 20000 --records games.csv --output sweep.json
+#
+# Every list-valued option is one axis of the grid; each combination is a
+# parameter set played --games times with seeds --seed, --seed + 1, ... so sets
+# are compared on the same games. Each game returns one compact record, written
+# to --records as soon as it arrives.
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from .config import DEFAULT_TUNING, TICK_RATE
+from .simulation import Simulation, SimInput
+from .stats import percentile
+
+# One finished game. force_fields counts every activation, free or paid.
+GameRecord = namedtuple("GameRecord", "set_index seed wave score tokens force_fields ticks")
+
+MAX_TICKS = 10 * 60 * TICK_RATE  # Games still running after 10 minutes are cut off.
+BOT_DRONE_INTERVAL = 10 * TICK_RATE
+BOT_SHIELD_RADIUS = 80  # Raise the force field for enemy bullets this close.
+
+# ---------------- Bot Pilot -----------------
+def bot_input(sim, drone_interval=BOT_DRONE_INTERVAL):
+    # Turn towards the nearest enemy, close in when far away, fire when lined
+    # up, deploy drones every drone_interval ticks and raise the force field
+    # when an enemy bullet gets close.
+    player = sim.player
+    left = right = thrust = fire = False
+    if sim.enemies:
+        target = min(sim.enemies, key=lambda e: (e.x - player.x) ** 2 + (e.y - player.y) ** 2)
+        dx = target.x - player.x
+        dy = target.y - player.y
+        desired = math.degrees(math.atan2(-dy, dx))
+        diff = (desired - player.angle + 180) % 360 - 180
+        left = diff > player.rotation_speed
+        right = diff < -player.rotation_speed
+        thrust = abs(diff) < 30 and dx * dx + dy * dy > 250 * 250
+        fire = abs(diff) < 15
+    force_field = False
+    if not sim.force_field_active:
+        reach = BOT_SHIELD_RADIUS * BOT_SHIELD_RADIUS
+        xs, ys = sim.enemy_bullets.positions()
+        force_field = any((x - player.x) ** 2 + (y - player.y) ** 2 < reach for x, y in zip(xs, ys))
+    deploy = sim.ticks % drone_interval == 0
+    return SimInput(left, right, thrust, fire, deploy, force_field)
+
+def play_game(job):
+    # Runs in a worker process; job is (set_index, params, seed, max_ticks).
+    set_index, params, seed, max_ticks = job
+    tuning = DEFAULT_TUNING._replace(**{k: v for k, v in params.items() if k in DEFAULT_TUNING._fields})
+    sim = Simulation(aggression=params.get("aggression", 1.0), seed=seed, tuning=tuning)
+    while not sim.game_over and sim.ticks < max_ticks:
+        sim.step(bot_input(sim))
+    return GameRecord(set_index, seed, sim.wave, sim.score, sim.tokens_earned,
+                      sim.force_fields_used, sim.ticks)
+
+# ---------------- Aggregation -----------------
+def summarize(values):
+    ordered = sorted(values)
+    return {"mean": sum(ordered) / len(ordered), "p10": percentile(ordered, 10),
+            "p50": percentile(ordered, 50), "p90": percentile(ordered, 90)}
+
+def aggregate(param_sets, records):
+    by_set = [[] for _ in param_sets]
+    for record in records:
+        by_set[record.set_index].append(record)
+    summary = []
+    for params, games in zip(param_sets, by_set):
+        if not games:
+            continue
+        entry = {"params": params, "games": len(games)}
+        for field in ("wave", "score", "tokens", "force_fields", "ticks"):
+            entry[field] = summarize([getattr(game, field) for game in games])
+        entry["timed_out"] = sum(1 for game in games if game.ticks >= params["max_ticks"])
+        summary.append(entry)
+    return summary
+
+def print_summary(summary, out=sys.stdout):
+    for entry in summary:
+        params = ", ".join(f"{k}={v}" for k, v in entry["params"].items() if k != "max_ticks")
+        wave, score = entry["wave"], entry["score"]
+        print(f"{params}\n    games {entry['games']}  wave p10/p50/p90 {wave['p10']}/{wave['p50']}/"
+              f"{wave['p90']}  score mean {score['mean']:.0f}  tokens mean "
+              f"{entry['tokens']['mean']:.2f}  force fields mean {entry['force_fields']['mean']:.2f}"
+              f"  survived mean {entry['ticks']['mean'] / TICK_RATE:.0f}s"
+              f"  timed out {entry['timed_out']}", file=out)
+
+# ---------------- Command Line -----------------
+# Sweep axes: option name -> (Tuning field or "aggression", value type).
+AXES = {
+    "aggression": ("aggression", float),
+    "chasers_per_wave": ("chasers_per_wave", float),
+    "snipers_per_wave": ("snipers_per_wave", float),
+    "chaser_cooldown": ("chaser_cooldown", int),
+    "sniper_cooldown": ("sniper_cooldown", int),
+    "force_field_duration": ("force_field_duration", int),
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m eve.sweep",
+                                     description="Seeded, bot-piloted balancing sweeps.")
+    parser.add_argument("--games", type=int, default=100, help="games per parameter set (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS,
+                        help=f"cut games off after this many ticks (default: {MAX_TICKS})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="worker processes (default: one per CPU)")
+    for name, (field, kind) in AXES.items():
+        default = 1.0 if field == "aggression" else getattr(DEFAULT_TUNING, field)
+        parser.add_argument("--" + name.replace("_", "-"), type=kind, nargs="+", default=[default],
+                            metavar="V", help=f"values to sweep (default: {default})")
+    parser.add_argument("--records", metavar="PATH", help="stream one CSV row per game to this file")
+    parser.add_argument("--output", metavar="PATH", help="write the aggregated results as JSON")
+    args = parser.parse_args(argv)
+
+    axes = [(name, getattr(args, name)) for name in AXES]
+    param_sets = [dict(zip([name for name, _ in axes], values), max_ticks=args.max_ticks)
+                  for values in itertools.product(*[values for _, values in axes])]
+    jobs = [(index, params, args.seed + game, args.max_ticks)
+            for index, params in enumerate(param_sets) for game in range(args.games)]
+
+    records = []
+    sink = open(args.records, "w", newline="") if args.records else None
+    writer = csv.writer(sink) if sink else None
+    if writer:
+        writer.writerow(GameRecord._fields)
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            chunk = max(1, len(jobs) // (args.workers * 8))
+            for done, record in enumerate(pool.map(play_game, jobs, chunksize=chunk), 1):
+                records.append(record)
+                if writer:
+                    writer.writerow(record)
+                if done % 100 == 0 or done == len(jobs):
+                    print(f"\r{done}/{len(jobs)} games", end="", file=sys.stderr, flush=True)
+    finally:
+        if sink:
+            sink.close()
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(records)} games in {elapsed:.1f}s", file=sys.stderr)
+
+    summary = aggregate(param_sets, records)
+    print_summary(summary)
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed,
+                       "games_per_set": args.games, "elapsed_s": elapsed, "results": summary},
+                      fh, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+# ---------------- Game Event Telemetry -----------------
+# The Simulation reports gameplay events by appending a tuple (kind, tick,
+# *fields) to its `events` sink (see Simulation.events); with the default of
+# None the only cost is one attribute check at each event point. A
+# TelemetryWriter provides that sink as a deque, which the game thread appends
+# to and a background thread drains, so emitting is one tuple plus one append
+# and the disk is only ever touched off the game thread.
+#
+# Files are append-only text, one event per line: the kind, the tick and the
+# fields, separated by spaces. Each file starts with a "#" header line. A file
+# that grows past max_bytes is closed and the next event opens a new one,
+# numbered in sequence: events-<started>-0000.log, events-<started>-0001.log...
+#
+# Kinds and fields:
+#   start   tick seed aggression          game started (emitted by the game)
+#   kill    tick enemy_class by_player    enemy destroyed; by_player 0 = drone bullet
+#   token   tick tokens                   token awarded for a GREEN sniper; new balance
+#   field   tick paid tokens              force field raised; paid 0 = free activation
+#   drones  tick live_drones              three drones deployed
+#   wave    tick wave enemies             next wave spawned
+#   over    tick score wave               player destroyed
+START = "start"
+KILL = "kill"
+TOKEN = "token"
+FORCE_FIELD = "field"
+DRONES = "drones"
+WAVE = "wave"
+GAME_OVER = "over"
+
+FORMAT_VERSION = 1
+ROTATE_BYTES = 4 * 1024 * 1024
+FLUSH_INTERVAL = 0.5  # seconds between background writes
+
+class TelemetryWriter:
+    def __init__(self, directory, max_bytes=ROTATE_BYTES, flush_interval=FLUSH_INTERVAL):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.prefix = time.strftime("events-%Y%m%d-%H%M%S")
+        self.events = deque()  # The sink handed to Simulation.events.
+        self.written = 0
+        self.files = 0
+        self._file = None
+        self._size = 0
+        self._stop = threading.Event()
+        os.makedirs(directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._flush_loop, name="telemetry-writer", daemon=True)
+        self._thread.start()
+
+    def _open(self):
+        path = os.path.join(self.directory, f"{self.prefix}-{self.files:04d}.log")
+        self.files += 1
+        self._file = open(path, "a", encoding="utf-8", newline="\n")
+        header = f"# eve telemetry {FORMAT_VERSION} {time.strftime('%Y-%m-%dT%H:%M:%S')}\n"
+        self._file.write(header)
+        self._size = len(header)
+
+    def _drain(self):
+        # Pop whatever the game thread has appended so far; popleft() and
+        # append() on a deque are safe to mix across threads.
+        events = self.events
+        lines = []
+        while events:
+            lines.append(" ".join(map(str, events.popleft())))
+        if not lines:
+            return
+        try:
+            for line in lines:
+                if self._file is None or self._size >= self.max_bytes:
+                    if self._file is not None:
+                        self._file.close()
+                    self._open()
+                self._file.write(line)
+                self._file.write("\n")
+                self._size += len(line) + 1
+            self._file.flush()
+        except OSError as exc:
+            # Drop this batch but keep the writer alive for later ones.
+            print(f"Could not write telemetry: {exc}", file=sys.stderr)
+            self._file = None
+            return
+        self.written += len(lines)
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self._drain()
+
+    def close(self):
+        # Stop the writer thread, then write whatever is still queued.
+        self._stop.set()
+        self._thread.join()
+        self._drain()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+import pygame
+
+# ---------------- Font Registry -----------------
+# pygame.font.SysFont scans the system font list on every call, so each
+# (name, size) pair is loaded once and shared.
+_fonts = {}
+
+def get_font(size, name=None):
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.SysFont(name, size)
+    return font
+
+# ---------------- Text Surface Cache -----------------
+# Bounded LRU of rendered text surfaces keyed by (text, font, color, antialias).
+# Use it for strings that repeat across frames (titles, labels, high scores);
+# text that changes every frame should be rendered directly instead of churning
+# the cache.
+TEXT_CACHE_SIZE = 256
+
+class TextCache:
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, text, font, color, antialias=True):
+        key = (text, font, color, antialias)
+        surfaces = self._surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = surfaces[key] = font.render(text, antialias, color)
+        if len(surfaces) > self.maxsize:
+            surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+text_cache = TextCache()
+
+def render_text(text, size, color, antialias=True, font_name=None):
+    return text_cache.render(text, get_font(size, font_name), color, antialias)
+
+# ---------------- HUD Widgets -----------------
+# A text line bound to one value: the surface is re-rendered only when the value
+# differs from the one it was last rendered with.
+_UNSET = object()
+
+class HudLabel:
+    def __init__(self, template, size, color, font_name=None):
+        self.template = template
+        self.size = size
+        self.color = color
+        self.font_name = font_name
+        self.value = _UNSET
+        self.surface = None
+
+    def update(self, value):
+        if value != self.value:
+            self.value = value
+            font = get_font(self.size, self.font_name)
+            self.surface = font.render(self.template.format(value), True, self.color)
+        return self.surface
@@ -0,0 +1,89 @@
+import copy
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from eve import ai
+from eve.bullets import BulletPool
+from eve.config import WORLD_WIDTH, WORLD_HEIGHT, RED, YELLOW
+from eve.entities import AI_Chaser, AI_Sniper, Spaceship
+
+TICKS = 240
+
+def _ships(kind, count, rng):
+    # Ships all around the target, so every steering branch is taken, with
+    # per-ship tuning as spawn_enemies() would scale it.
+    ships = []
+    for _ in range(count):
+        ship = kind(rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT), RED)
+        aggression = rng.choice((0.25, 1.0, 2.0))
+        ship.acceleration *= aggression
+        ship.rotation_speed *= aggression
+        ship.shot_cooldown = int(ship.shot_cooldown / aggression)
+        ship.angle = rng.uniform(-400, 400)
+        ship.velocity.update(rng.uniform(-3, 3), rng.uniform(-3, 3))
+        ships.append(ship)
+    return ships
+
+@pytest.mark.parametrize("kind", [AI_Chaser, AI_Sniper])
+def test_kernel_matches_update_ai(kind):
+    rng = random.Random(7)
+    ships = _ships(kind, 40, rng)
+    reference = copy.deepcopy(ships)
+    target = Spaceship(WORLD_WIDTH / 2, WORLD_HEIGHT / 2, YELLOW)
+    batch = ai.ShipArrays(ships)
+    kernel = ai.KERNELS[kind]
+    bullets = BulletPool()
+    expected_bullets = BulletPool()
+    for tick in range(1, TICKS):
+        now = tick * 1000 / 60
+        target.x = WORLD_WIDTH / 2 + 400 * math.cos(tick / 40)
+        target.y = WORLD_HEIGHT / 2 + 300 * math.sin(tick / 40)
+        ai.spawn_shots(batch, kernel(batch, target.x, target.y, now), bullets, now)
+        ai.move(batch)
+        batch.store()
+        for ship in reference:
+            ship.update_ai(target, expected_bullets, now)
+            ship.update()
+    batch.flush()
+
+    for ship, expected in zip(ships, reference):
+        assert ship.x == pytest.approx(expected.x, abs=1e-6)
+        assert ship.y == pytest.approx(expected.y, abs=1e-6)
+        assert ship.prev_x == pytest.approx(expected.prev_x, abs=1e-6)
+        assert ship.angle == pytest.approx(expected.angle, abs=1e-6)
+        assert ship.velocity.x == pytest.approx(expected.velocity.x, abs=1e-6)
+        assert ship.velocity.y == pytest.approx(expected.velocity.y, abs=1e-6)
+        assert ship.last_shot == expected.last_shot
+    assert len(bullets) > 0
+    assert len(bullets) == len(expected_bullets)
+    for row, expected in zip(bullets.get_state(), expected_bullets.get_state()):
+        assert row[:4] == pytest.approx(expected[:4], abs=1e-6)
+        assert row[4:] == expected[4:]
+
+def test_enemy_ai_batches_large_groups():
+    # EnemyAI.update() drives groups of BATCH_MIN or more through the kernels
+    # and must leave the ships where their own update_ai() would.
+    rng = random.Random(11)
+    ships = _ships(AI_Chaser, ai.BATCH_MIN, rng) + _ships(AI_Sniper, ai.BATCH_MIN, rng)
+    reference = copy.deepcopy(ships)
+    target = Spaceship(WORLD_WIDTH / 2, WORLD_HEIGHT / 2, YELLOW)
+    enemy_ai = ai.EnemyAI()
+    bullets = BulletPool()
+    expected_bullets = BulletPool()
+    for tick in range(1, 120):
+        now = tick * 1000 / 60
+        enemy_ai.update(ships, target, bullets, now)
+        for ship in reference:
+            ship.update_ai(target, expected_bullets, now)
+            ship.update()
+    enemy_ai.flush()
+
+    assert enemy_ai._batches
+    for ship, expected in zip(ships, reference):
+        assert (ship.x, ship.y) == pytest.approx((expected.x, expected.y), abs=1e-6)
+        assert ship.last_shot == expected.last_shot
+    assert len(bullets) == len(expected_bullets)
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from eve import bullets as bullet_module
+from eve.bullets import BULLET_LIFETIME, OWNER_DRONE, OWNER_PLAYER, swap_remove_plan
+from eve.config import WORLD_WIDTH, WORLD_HEIGHT
+
+POOLS = [bullet_module._ArrayBulletPool,
+         pytest.param(bullet_module._NumpyBulletPool,
+                      marks=pytest.mark.skipif(bullet_module.np is None, reason="needs NumPy"))]
+
+def _row(i):
+    # A bullet whose every field identifies it.
+    return [float(i), float(i + 1), 0.5, -0.5, [i % 256, (i * 7) % 256, (i * 13) % 256],
+            OWNER_PLAYER if i % 2 else OWNER_DRONE, float(i)]
+
+def _spawn(pool, ids):
+    for i in ids:
+        x, y, vx, vy, color, owner, now = _row(i)
+        pool.spawn(x, y, vx, vy, color, owner, now)
+
+def _swap_removed(rows, holes):
+    # What swap-remove must leave: holes refilled from the live tail, in order.
+    dst, src, new_count = swap_remove_plan(sorted(set(holes)), len(rows))
+    rows = list(rows)
+    for d, s in zip(dst, src):
+        rows[d] = rows[s]
+    return rows[:new_count]
+
+@pytest.mark.parametrize("pool_class", POOLS)
+def test_swap_remove(pool_class):
+    rng = random.Random(5)
+    pool = pool_class(capacity=8)
+    _spawn(pool, range(100))
+    assert len(pool) == 100
+    assert pool.misses > 0
+    expected = [_row(i) for i in range(100)]
+    while expected:
+        holes = [rng.randrange(len(expected)) for _ in range(rng.randint(1, 12))]
+        holes.append(len(expected) - 1)  # Always include the tail row.
+        pool.remove(holes)
+        expected = _swap_removed(expected, holes)
+        assert pool.get_state() == expected
+    assert len(pool) == 0
+    pool.remove([])
+    assert len(pool) == 0
+
+@pytest.mark.parametrize("pool_class", POOLS)
+def test_update_expires_and_culls(pool_class):
+    pool = pool_class()
+    pool.spawn(100, 100, 1, 0, (1, 2, 3), OWNER_PLAYER, 0)       # expires
+    pool.spawn(100, 100, 1, 0, (4, 5, 6), OWNER_PLAYER, 500)     # lives
+    pool.spawn(0.5, 100, -1, 0, (7, 8, 9), OWNER_PLAYER, 500)    # leaves the world
+    pool.spawn(200, 200, 0, 1, (10, 11, 12), OWNER_DRONE, 500)   # lives
+    pool.update(BULLET_LIFETIME + 1)
+    assert pool.get_state() == [[200.0, 201.0, 0.0, 1.0, [10, 11, 12], OWNER_DRONE, 500.0],
+                                [101.0, 100.0, 1.0, 0.0, [4, 5, 6], OWNER_PLAYER, 500.0]]
+    xs, ys = pool.positions()
+    assert xs == [200.0, 101.0]
+    assert ys == [201.0, 100.0]
+
+@pytest.mark.parametrize("pool_class", POOLS)
+def test_state_round_trip(pool_class):
+    pool = pool_class()
+    _spawn(pool, range(10))
+    copy = pool_class()
+    copy.set_state(pool.get_state())
+    assert copy.get_state() == pool.get_state()
+
+@pytest.mark.parametrize("pool_class", POOLS)
+def test_rows_near_keeps_every_close_bullet(pool_class):
+    rng = random.Random(9)
+    pool = pool_class()
+    for _ in range(2000):
+        pool.spawn(rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT), 0, 0, (1, 2, 3),
+                   OWNER_PLAYER, 0)
+    pool.spawn(0, 0, 0, 0, (1, 2, 3), OWNER_PLAYER, 0)
+    pool.spawn(WORLD_WIDTH, WORLD_HEIGHT, 0, 0, (1, 2, 3), OWNER_PLAYER, 0)
+    points = [(rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT)) for _ in range(40)]
+    points += [(0, 0), (WORLD_WIDTH, WORLD_HEIGHT)]
+    xs, ys = pool.positions()
+    for r in (15, 100):
+        rows, near_xs, near_ys = pool.rows_near([p[0] for p in points], [p[1] for p in points], r, 64)
+        assert rows == sorted(set(rows))
+        assert near_xs == [xs[row] for row in rows]
+        assert near_ys == [ys[row] for row in rows]
+        close = [row for row, (x, y) in enumerate(zip(xs, ys))
+                 if any((x - px) ** 2 + (y - py) ** 2 < r * r for px, py in points)]
+        assert set(close) <= set(rows)
+        assert len(rows) < len(xs)
+    assert pool.rows_near([], [], 15, 64) == ([], [], [])
@@ -0,0 +1,90 @@
+import copy
+import random
+
+import pytest
+
+from eve import bullets as bullet_module
+from eve.bullets import BulletPool, OWNER_ENEMY
+from eve.collision import SpatialHash, resolve_bullet_hits
+from eve.config import RED, YELLOW
+from eve.entities import Spaceship
+
+POOLS = [bullet_module._ArrayBulletPool,
+         pytest.param(bullet_module._NumpyBulletPool,
+                      marks=pytest.mark.skipif(bullet_module.np is None, reason="needs NumPy"))]
+
+def _nested_loops(bullets, ships, damage):
+    # The rules resolve_bullet_hits() replaced: every bullet, in row order,
+    # against every ship still alive, in list order; the first overlap takes the
+    # damage and spends the bullet, and a ship is gone once its health is down.
+    spent = set()
+    killed = []
+    alive = list(ships)
+    xs, ys = bullets.positions()
+    for row, (bx, by) in enumerate(zip(xs, ys)):
+        for ship in alive:
+            dx = bx - ship.x
+            dy = by - ship.y
+            if dx * dx + dy * dy < ship.radius * ship.radius:
+                ship.health -= damage
+                spent.add(row)
+                if ship.health <= 0:
+                    alive.remove(ship)
+                    killed.append((ship, row))
+                break
+    return spent, killed
+
+def _crowd(rng, count):
+    # Overlapping ships in a small area, so many bullets touch several at once.
+    ships = []
+    for _ in range(count):
+        ship = Spaceship(rng.uniform(100, 300), rng.uniform(100, 300), RED)
+        ship.health = rng.choice((10, 20, 40, 100))
+        ships.append(ship)
+    return ships
+
+def _bullets(rng, count, pool_class=BulletPool):
+    bullets = pool_class()
+    for _ in range(count):
+        bullets.spawn(rng.uniform(80, 320), rng.uniform(80, 320), 0, 0, YELLOW, OWNER_ENEMY, 0)
+    return bullets
+
+@pytest.mark.parametrize("pool_class", POOLS)
+def test_matches_nested_loops(pool_class):
+    for seed in range(20):
+        rng = random.Random(seed)
+        ships = _crowd(rng, 30)
+        reference = copy.deepcopy(ships)
+        bullets = _bullets(rng, 200, pool_class)
+        spent, killed = resolve_bullet_hits(bullets, ships, SpatialHash(), 20)
+        expected_spent, expected_killed = _nested_loops(bullets, reference, 20)
+        assert spent == expected_spent
+        assert [(ships.index(ship), row) for ship, row in killed] == \
+               [(reference.index(ship), row) for ship, row in expected_killed]
+        assert [ship.health for ship in ships] == [ship.health for ship in reference]
+
+def test_first_ship_in_list_order_takes_the_hit():
+    first = Spaceship(100, 100, RED)
+    second = Spaceship(105, 100, RED)
+    bullets = BulletPool()
+    bullets.spawn(103, 100, 0, 0, YELLOW, OWNER_ENEMY, 0)
+    for ships in ([first, second], [second, first]):
+        first.health = second.health = 100
+        spent, killed = resolve_bullet_hits(bullets, ships, SpatialHash(), 30)
+        assert spent == {0}
+        assert killed == []
+        assert ships[0].health == 70
+        assert ships[1].health == 100
+
+def test_force_field_absorbs_without_damage():
+    # The player under a force field is resolved with damage 0: bullets that
+    # reach it are spent, but it takes no damage and cannot be killed.
+    player = Spaceship(200, 200, YELLOW)
+    player.health = 10
+    bullets = BulletPool()
+    for dx in (-5, 0, 5, 50):
+        bullets.spawn(200 + dx, 200, 0, 0, RED, OWNER_ENEMY, 0)
+    spent, killed = resolve_bullet_hits(bullets, [player], SpatialHash(), 0)
+    assert spent == {0, 1, 2}
+    assert killed == []
+    assert player.health == 10
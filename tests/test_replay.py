@@ -0,0 +1,66 @@
+import json
+
+from eve import Simulation, SimInput
+from eve.replay import Replay, ReplayWriter, decode_runs, encode_runs, verify
+
+TICKS = 900
+CHECKPOINTS = (0, 1, 119, 120, 121, 333, 600, 899, TICKS)
+
+def _inputs(tick):
+    # A scripted pilot: turns, thrusts and fires in overlapping rhythms.
+    return SimInput(left=tick % 50 < 10, right=tick % 170 < 20, thrust=tick % 30 < 5,
+                    fire=tick % 7 < 5, deploy_drones=tick % 400 == 0, force_field=tick == 450)
+
+def _state(sim):
+    return json.dumps(sim.snapshot(), sort_keys=True)
+
+def _record(path):
+    # Record TICKS ticks and return the state after each checkpoint tick.
+    sim = Simulation(seed=42, start_wave=3)
+    writer = ReplayWriter(path, sim, keyframe_interval=120)
+    states = {0: _state(sim)}
+    for tick in range(TICKS):
+        inputs = _inputs(tick)
+        writer.record(inputs)
+        sim.step(inputs)
+        if sim.ticks in CHECKPOINTS:
+            states[sim.ticks] = _state(sim)
+    writer.close()
+    return states
+
+def test_runs_round_trip():
+    masks = bytes([0] * 300 + [5, 5, 63] + [1] * 129 + [0])
+    assert bytes(decode_runs(encode_runs(masks))) == masks
+    assert encode_runs(b"") == b""
+
+def test_round_trip_and_seek(tmp_path):
+    path = str(tmp_path / "game.evr")
+    states = _record(path)
+    replay = Replay(path)
+    try:
+        assert replay.ticks == TICKS
+        assert len(replay.blocks) == TICKS // 120 + 1
+        assert list(replay.inputs()) == [_inputs(tick) for tick in range(TICKS)]
+        assert replay.input_at(333) == _inputs(333)
+        assert verify(replay) is None
+        for tick in CHECKPOINTS:
+            assert _state(replay.seek(tick)) == states[tick], tick
+        # Seeking backwards and forwards through one reused Simulation.
+        sim = replay.new_simulation()
+        for tick in reversed(CHECKPOINTS):
+            assert _state(replay.seek(tick, sim)) == states[tick], tick
+        assert replay.seek(TICKS + 100).ticks == TICKS
+    finally:
+        replay.close()
+
+def test_truncated_file_keeps_complete_blocks(tmp_path):
+    path = tmp_path / "game.evr"
+    states = _record(str(path))
+    path.write_bytes(path.read_bytes()[:-50])
+    replay = Replay(str(path))
+    try:
+        assert 0 < replay.ticks < TICKS
+        assert verify(replay) is None
+        assert _state(replay.seek(120)) == states[120]
+    finally:
+        replay.close()